@@ -15,7 +15,7 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 from app.core.database import Base
-from app.models import Project, Scene  # noqa: F401
+from app.models import Project, Scene, Job, OutlineCacheEntry  # noqa: F401
 
 target_metadata = Base.metadata
 
@@ -6,6 +6,8 @@ class Settings(BaseSettings):
     USE_MOCK_AI: bool = True
     USE_MOCK_TTS: bool = True
     TTS_VOICE: str = "alloy"
+    TTS_MODEL: str = "tts-1"
+    TTS_FORMAT: str = "pcm"  # pcm or wav; both are saved as WAV
     DATABASE_URL: str = "sqlite+aiosqlite:///./studyscenes.db"
     STORAGE_PATH: str = "./storage"
     BACKEND_HOST: str = "0.0.0.0"
@@ -15,6 +17,29 @@ class Settings(BaseSettings):
     RUNWAY_API_KEY: str = ""
     SCENE_CLIP_SECONDS: int = 6
     MAX_TOTAL_VIDEO_SECONDS: int = 90
+    CLIP_DURATION_MODE: str = "fixed"  # fixed, audio_first, estimate
+    ASSET_CONCURRENCY_ENABLED: bool = True
+    CLIP_CONCURRENCY: int = 2
+    IMAGE_CONCURRENCY: int = 4
+    TTS_CONCURRENCY: int = 4
+    FFMPEG_WORKERS: int = 0  # concurrent segment encoders; 0 = CPU count
+    VIDEO_RENDERER: str = "segments"  # segments or filtergraph
+    ENCODER_PROFILE: str = "standard"  # draft, standard or archival
+    VIDEO_PREVIEW_ENABLED: bool = True  # low-res preview before the final render
+    JOB_LEASE_SECONDS: int = 60
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: int = 10
+    JOB_POLL_INTERVAL: float = 1.0
+    OPENAI_RPM: int = 500  # requests/minute; 0 = unlimited
+    OPENAI_CONCURRENCY: int = 8
+    RUNWAY_RPM: int = 30
+    RUNWAY_CONCURRENCY: int = 2  # task create calls in flight
+    RUNWAY_MAX_TASKS: int = 8  # tasks submitted and not yet finished
+    PROVIDER_MAX_RETRIES: int = 5  # retries of a throttled (429/503) call
+    CPU_WORKERS: int = 0  # rendering processes; 0 = CPU count
+    IO_WORKERS: int = 8  # threads for blocking file I/O
+    ASSET_CACHE_ENABLED: bool = True
+    ASSET_CACHE_MAX_BYTES: int = 5 * 1024 ** 3
 
     @property
     def storage_dir(self) -> Path:
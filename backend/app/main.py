@@ -1,11 +1,24 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.database import get_db
 from app.routers import projects, generation
+from app.services import encoding, executors, jobs
+from app.services.asset_cache import AssetCache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    executors.shutdown()
 
-app = FastAPI(title="StudyScenes", version="0.1.0")
+
+app = FastAPI(title="StudyScenes", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,3 +39,24 @@ app.mount("/storage", StaticFiles(directory=str(storage_dir)), name="storage")
 @app.get("/api/health")
 async def health():
     return {"status": "ok"}
+
+
+def _asset_cache_stats() -> dict:
+    return AssetCache().stats()
+
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    # SQLite reads; keep them off the event loop
+    return await executors.run_io(_asset_cache_stats)
+
+
+@app.get("/api/executors/stats")
+async def executor_stats(db: AsyncSession = Depends(get_db)):
+    # Rendering runs in worker processes; this API process's own pools sit idle
+    return await jobs.executor_stats(db)
+
+
+@app.get("/api/encoder-profiles")
+async def encoder_profiles():
+    return encoding.list_profiles()
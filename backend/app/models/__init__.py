@@ -1,4 +1,6 @@
 from app.models.project import Project
 from app.models.scene import Scene
+from app.models.job import Job
+from app.models.outline_cache import OutlineCacheEntry
 
-__all__ = ["Project", "Scene"]
+__all__ = ["Project", "Scene", "Job", "OutlineCacheEntry"]
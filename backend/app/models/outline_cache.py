@@ -0,0 +1,16 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import String, JSON, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class OutlineCacheEntry(Base):
+    """A generated outline, keyed by a hash of the source content and model inputs."""
+
+    __tablename__ = "outline_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    outline: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -28,3 +28,4 @@ class Project(Base):
     scenes: Mapped[list["Scene"]] = relationship(
         "Scene", back_populates="project", cascade="all, delete-orphan", order_by="Scene.order_index"
     )
+    jobs: Mapped[list["Job"]] = relationship("Job", cascade="all, delete-orphan")
@@ -18,6 +18,14 @@ class Scene(Base):
     visual_desc: Mapped[str] = mapped_column(Text, nullable=False)
     image_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
     duration_sec: Mapped[float] = mapped_column(Float, default=0.0)
+    # Checkpoints: input hashes of the last successfully generated assets
+    visual_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    audio_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     project: Mapped["Project"] = relationship("Project", back_populates="scenes")
+
+    @property
+    def dirty(self) -> bool:
+        """True when the visual or narration needs (re)generating."""
+        return self.visual_hash is None or self.audio_hash is None
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -10,15 +10,19 @@ from app.schemas.generation import (
     AssetStatusResponse,
     VideoStatusResponse,
 )
-from app.services import pipeline
+from app.services import jobs, pipeline
+from app.services.encoding import PROFILES
 
 router = APIRouter(prefix="/api/projects", tags=["generation"])
 
 
 @router.post("/{project_id}/generate/outline", response_model=OutlineResponse)
-async def generate_outline(project_id: str, db: AsyncSession = Depends(get_db)):
+async def generate_outline(
+    project_id: str, fresh: bool = False, db: AsyncSession = Depends(get_db)
+):
+    """Generate the outline; ``fresh=true`` skips the outline cache for a new variation."""
     try:
-        return await pipeline.generate_outline(project_id, db)
+        return await pipeline.generate_outline(project_id, db, bypass_cache=fresh)
     except ValueError as e:
         if "OPENAI_API_KEY" in str(e):
             raise HTTPException(status_code=400, detail=str(e))
@@ -56,12 +60,8 @@ async def save_script(project_id: str, data: ScriptUpdate, db: AsyncSession = De
 
 
 @router.post("/{project_id}/generate/assets")
-async def generate_assets(
-    project_id: str,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
-):
-    # Verify project exists before starting background task
+async def generate_assets(project_id: str, db: AsyncSession = Depends(get_db)):
+    # Verify project exists before queueing the job
     try:
         project = await pipeline._get_project(project_id, db)
     except ValueError as e:
@@ -70,32 +70,50 @@ async def generate_assets(
     if not project.script:
         raise HTTPException(status_code=400, detail="Script must be generated first")
 
-    # Run asset generation in background
-    background_tasks.add_task(_run_asset_generation, project_id)
-    return {"status": "started", "message": "Asset generation started"}
+    # Picked up by a worker process (python -m app.worker)
+    job = await jobs.enqueue(db, project_id, "assets")
+    return {"status": "started", "job_id": job.id, "message": "Asset generation queued"}
+
 
+@router.post("/{project_id}/scenes/{scene_index}/regenerate")
+async def regenerate_scene(project_id: str, scene_index: int, db: AsyncSession = Depends(get_db)):
+    """Regenerate one scene's visual and narration without touching the rest."""
+    try:
+        project = await pipeline._get_project(project_id, db, load_scenes=True)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
-async def _run_asset_generation(project_id: str):
-    from app.core.database import async_session
-    async with async_session() as db:
-        try:
-            await pipeline.generate_assets(project_id, db)
-        except Exception:
-            pass  # Status tracked in pipeline
+    if not 0 <= scene_index < len(project.scenes):
+        raise HTTPException(status_code=404, detail=f"Scene {scene_index} not found")
+
+    job = await jobs.enqueue(db, project_id, "scene_assets", {"scene_index": scene_index})
+    return {"status": "started", "job_id": job.id, "message": f"Regenerating scene {scene_index}"}
 
 
 @router.get("/{project_id}/generate/assets/status", response_model=AssetStatusResponse)
-async def get_asset_status(project_id: str):
-    status = pipeline.get_asset_status(project_id)
+async def get_asset_status(project_id: str, db: AsyncSession = Depends(get_db)):
+    status = await jobs.get_stage_status(db, project_id, "assets")
     return AssetStatusResponse(**status)
 
 
+def _profile_payload(profile: str | None) -> dict | None:
+    """Job payload selecting an encoder profile; None keeps the configured default."""
+    if profile is None:
+        return None
+    if profile not in PROFILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown encoder profile '{profile}'; choose from {', '.join(PROFILES)}",
+        )
+    return {"profile": profile}
+
+
 @router.post("/{project_id}/generate/video")
 async def generate_video(
-    project_id: str,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
+    project_id: str, profile: str | None = None, db: AsyncSession = Depends(get_db)
 ):
+    """Queue the video render; ``profile`` picks an encoder profile (draft, standard, archival)."""
+    payload = _profile_payload(profile)
     try:
         project = await pipeline._get_project(project_id, db)
     except ValueError as e:
@@ -104,20 +122,29 @@ async def generate_video(
     if project.status not in ("assets_ready", "video_ready"):
         raise HTTPException(status_code=400, detail="Assets must be generated first")
 
-    background_tasks.add_task(_run_video_generation, project_id)
-    return {"status": "started", "message": "Video generation started"}
-
-
-async def _run_video_generation(project_id: str):
-    from app.core.database import async_session
-    async with async_session() as db:
-        try:
-            await pipeline.generate_video(project_id, db)
-        except Exception:
-            pass  # Status tracked in pipeline
+    job = await jobs.enqueue(db, project_id, "video", payload)
+    return {"status": "started", "job_id": job.id, "message": "Video generation queued"}
 
 
 @router.get("/{project_id}/generate/video/status", response_model=VideoStatusResponse)
-async def get_video_status(project_id: str):
-    status = pipeline.get_video_status(project_id)
+async def get_video_status(project_id: str, db: AsyncSession = Depends(get_db)):
+    status = await jobs.get_stage_status(db, project_id, "video")
     return VideoStatusResponse(**status)
+
+
+@router.post("/{project_id}/generate/all")
+async def generate_all(
+    project_id: str, profile: str | None = None, db: AsyncSession = Depends(get_db)
+):
+    """Generate assets and stream each finished scene straight into the video."""
+    payload = _profile_payload(profile)
+    try:
+        project = await pipeline._get_project(project_id, db)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if not project.script:
+        raise HTTPException(status_code=400, detail="Script must be generated first")
+
+    job = await jobs.enqueue(db, project_id, "all", payload)
+    return {"status": "started", "job_id": job.id, "message": "Asset and video generation queued"}
@@ -38,4 +38,5 @@ class VideoStatusResponse(BaseModel):
     status: str  # pending, in_progress, completed, failed
     progress: float
     video_path: str | None = None
+    preview_path: str | None = None  # low-res render, available before video_path
     message: str
@@ -11,6 +11,7 @@ class SceneResponse(BaseModel):
     visual_desc: str
     image_path: str | None = None
     duration_sec: float
+    dirty: bool = True
     created_at: datetime
 
     model_config = {"from_attributes": True}
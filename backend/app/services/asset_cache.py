@@ -0,0 +1,179 @@
+"""Cross-project, content-addressed cache for generated assets.
+
+Clips, images and narration audio are stored once under
+``<storage>/_cache/objects`` keyed by a hash of their generation inputs, and
+indexed in a small SQLite database next to them. Hits are materialized into
+the project directory as a hardlink (or reflink/copy across filesystems), so
+reusing an asset costs no extra disk or copy time. The cache is kept under
+``ASSET_CACHE_MAX_BYTES`` by evicting least-recently-used entries.
+"""
+import fcntl
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Linux FICLONE ioctl: copy-on-write clone on btrfs/xfs
+_FICLONE = 0x40049409
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    meta TEXT,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entries_last_used ON entries (last_used);
+CREATE TABLE IF NOT EXISTS stats (
+    kind TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def materialize(src: Path, dest: Path) -> None:
+    """Place ``src``'s content at ``dest`` without copying bytes if possible."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(src, dest)
+        return
+    except OSError:
+        pass
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return
+    except OSError:
+        dest.unlink(missing_ok=True)
+    shutil.copy2(src, dest)
+
+
+def detach(path: Path) -> None:
+    """Unlink ``path`` before regenerating it.
+
+    Project files may be hardlinks to cache objects; writing into one in place
+    would silently change the cached copy too.
+    """
+    path.unlink(missing_ok=True)
+
+
+class AssetCache:
+    """SQLite-indexed store of generated assets shared by all projects."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+        self.root = root or settings.storage_dir / "_cache"
+        self.max_bytes = settings.ASSET_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.objects_dir = self.root / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._db_path = self.root / "index.db"
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Several worker processes may share the cache; let writers queue
+        conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def _object_path(self, key: str, suffix: str) -> Path:
+        return self.objects_dir / key[:2] / f"{key}{suffix}"
+
+    def fetch(self, kind: str, key: str, dest: Path) -> dict | None:
+        """Materialize a cached asset at ``dest`` and return its metadata.
+
+        Returns None (and counts a miss) if the key isn't cached.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT path, meta FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            obj = Path(row[0]) if row else None
+            if obj is None or not obj.exists():
+                if row:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._count(conn, kind, "misses")
+                return None
+
+            materialize(obj, dest)
+            conn.execute(
+                "UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._count(conn, kind, "hits")
+        logger.info("Asset cache hit (%s %s) -> %s", kind, key, dest)
+        return json.loads(row[1]) if row[1] else {}
+
+    def store(self, kind: str, key: str, src: Path, meta: dict | None = None) -> None:
+        """Add a freshly generated asset to the cache, then enforce the budget."""
+        if not src.exists() or src.stat().st_size == 0:
+            return
+        obj = self._object_path(key, src.suffix)
+        materialize(src, obj)
+        size = obj.stat().st_size
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, kind, path, size, meta, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, str(obj), size, json.dumps(meta) if meta else None, now, now),
+            )
+            self._evict(conn)
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            counters = {
+                kind: {"hits": hits, "misses": misses}
+                for kind, hits, misses in conn.execute("SELECT kind, hits, misses FROM stats")
+            }
+            entries, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "kinds": counters,
+        }
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection, kind: str, column: str) -> None:
+        conn.execute(
+            f"INSERT INTO stats (kind, {column}) VALUES (?, 1) "
+            f"ON CONFLICT(kind) DO UPDATE SET {column} = {column} + 1",
+            (kind,),
+        )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least-recently-used entries until the cache fits its budget."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key, path, size FROM entries ORDER BY last_used"
+        ).fetchall()
+        for key, path, size in rows:
+            if total <= self.max_bytes:
+                break
+            # Projects still holding a hardlink keep their copy
+            Path(path).unlink(missing_ok=True)
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            logger.info("Evicted cached asset %s (%d bytes)", key, size)
@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
 
 from app.schemas.generation import OutlineResponse
+from app.services.hashing import content_hash
 
 
 class OutlineServiceBase(ABC):
+    def cache_key(self, content: str) -> str:
+        """Key identifying the outline generate would produce for ``content``."""
+        return content_hash("outline", type(self).__name__, content)
+
     @abstractmethod
     async def generate(self, content: str) -> OutlineResponse:
         ...
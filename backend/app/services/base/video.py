@@ -12,11 +12,27 @@ class SceneInput:
 
 
 class VideoServiceBase(ABC):
+    # Whether render_segment produces per-scene segments that stitch joins.
+    # Single-pass renderers set this False and callers skip per-scene encodes.
+    renders_segments: bool = True
+
     @abstractmethod
     async def stitch(
         self,
         scenes: list[SceneInput],
         output_path: Path,
+        *,
+        cache_dir: Path | None = None,
     ) -> None:
-        """Stitch per-scene image+audio clips into a single MP4 video."""
+        """Stitch per-scene image+audio clips into a single MP4 video.
+
+        With ``cache_dir``, per-scene segments are kept there and reused by
+        later stitches whose inputs haven't changed.
+        """
+        ...
+
+    @abstractmethod
+    async def render_segment(self, scene: SceneInput, segment_dir: Path) -> Path:
+        """Encode one scene into ``segment_dir`` (reusing an identical cached
+        segment) and return the segment path."""
         ...
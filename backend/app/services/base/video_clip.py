@@ -1,8 +1,25 @@
+import asyncio
+import math
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass
+class ClipRequest:
+    scene_title: str
+    visual_desc: str
+    output_path: Path
+    narration: str = ""
+    duration_sec: int = 6
+
+
 class VideoClipServiceBase(ABC):
+    # Clip lengths the provider accepts; None means any whole number of seconds
+    valid_durations: tuple[int, ...] | None = None
+    # Clips the provider works on at once; None leaves it to CLIP_CONCURRENCY
+    max_in_flight: int | None = None
+
     @abstractmethod
     async def generate(
         self,
@@ -15,3 +32,29 @@ class VideoClipServiceBase(ABC):
     ) -> None:
         """Generate a video clip for a single scene."""
         ...
+
+    async def generate_batch(self, requests: list[ClipRequest]) -> list[Exception | None]:
+        """Generate several clips at once.
+
+        Every request is started up front; a provider that runs tasks
+        remotely submits them all before waiting on any. Returns one entry
+        per request, None on success or the exception that request raised.
+        """
+        results = await asyncio.gather(
+            *(
+                self.generate(
+                    r.scene_title, r.visual_desc, r.output_path,
+                    narration=r.narration, duration_sec=r.duration_sec,
+                )
+                for r in requests
+            ),
+            return_exceptions=True,
+        )
+        return [r if isinstance(r, Exception) else None for r in results]
+
+    def fit_duration(self, seconds: float) -> int:
+        """Shortest valid clip length covering ``seconds``, else the longest one."""
+        if not self.valid_durations:
+            return max(1, math.ceil(seconds))
+        covering = [d for d in self.valid_durations if d >= seconds]
+        return min(covering) if covering else max(self.valid_durations)
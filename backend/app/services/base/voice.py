@@ -1,8 +1,21 @@
+import re
+import unicodedata
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from app.services.hashing import content_hash
+
+
+def normalize_narration(narration: str) -> str:
+    """Canonical form of narration text: NFC, single spaces, no edge whitespace."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", narration)).strip()
+
 
 class VoiceServiceBase(ABC):
+    def cache_key(self, narration: str) -> str:
+        """Key identifying the audio generate_scene produces for ``narration``."""
+        return content_hash("tts", type(self).__name__, normalize_narration(narration))
+
     @abstractmethod
     async def generate_scene(self, narration: str, output_path: Path) -> float:
         """Generate audio for one scene. Returns duration in seconds."""
@@ -1,19 +1,47 @@
 import hashlib
 import json
+import logging
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clips (
+    scene_index INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL,
+    path TEXT NOT NULL
+);
+"""
+
 
 class ClipCache:
-    """JSON manifest cache for generated video clips."""
+    """Per-project index of generated video clips, stored in SQLite.
+
+    Each write is a single-row upsert, so concurrent jobs on the same project
+    can't clobber each other's entries and lookups don't load the whole index.
+    Every method may wait on another writer's lock, so async callers run
+    them on the I/O executor.
+    """
 
     def __init__(self, cache_path: Path) -> None:
         self._path = cache_path
-        self._data: dict[str, dict] = {}
-        if self._path.exists():
-            try:
-                self._data = json.loads(self._path.read_text())
-            except (json.JSONDecodeError, OSError):
-                self._data = {}
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+        self._import_legacy_manifest()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A Connection's own context manager only ends the transaction; close it too
+        conn = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
 
     @staticmethod
     def compute_hash(visual_desc: str, scene_title: str, duration: int) -> str:
@@ -21,12 +49,65 @@ class ClipCache:
         return hashlib.sha256(key.encode()).hexdigest()[:16]
 
     def is_valid(self, index: int, hash_val: str, path: Path) -> bool:
-        entry = self._data.get(str(index))
-        if not entry:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT hash, path FROM clips WHERE scene_index = ?", (index,)
+            ).fetchone()
+        if not row:
             return False
-        return entry.get("hash") == hash_val and Path(entry.get("path", "")).exists()
+        return row[0] == hash_val and Path(row[1]).exists()
 
     def set(self, index: int, hash_val: str, path: Path) -> None:
-        self._data[str(index)] = {"hash": hash_val, "path": str(path)}
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(json.dumps(self._data, indent=2))
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO clips (scene_index, hash, path) VALUES (?, ?, ?)",
+                (index, hash_val, str(path)),
+            )
+
+    def remap(self, moves: dict[int, int]) -> None:
+        """Follow clips whose scenes were reordered (old index -> new index)."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                moved = []
+                for old_index, new_index in moves.items():
+                    row = conn.execute(
+                        "SELECT hash, path FROM clips WHERE scene_index = ?", (old_index,)
+                    ).fetchone()
+                    if row:
+                        old_path = Path(row[1])
+                        new_path = old_path.with_name(f"scene_{new_index:03d}{old_path.suffix}")
+                        moved.append((new_index, row[0], str(new_path)))
+                indices = set(moves) | set(moves.values())
+                conn.executemany(
+                    "DELETE FROM clips WHERE scene_index = ?", [(i,) for i in indices]
+                )
+                conn.executemany(
+                    "INSERT INTO clips (scene_index, hash, path) VALUES (?, ?, ?)", moved
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _import_legacy_manifest(self) -> None:
+        """One-time import of the old ``cache.json`` manifest beside the index."""
+        legacy = self._path.with_name("cache.json")
+        if not legacy.exists():
+            return
+        try:
+            data = json.loads(legacy.read_text())
+        except (json.JSONDecodeError, OSError):
+            data = {}
+        rows = [
+            (int(index), entry["hash"], entry["path"])
+            for index, entry in data.items()
+            if isinstance(entry, dict) and "hash" in entry and "path" in entry
+        ]
+        with self._connect() as conn:
+            # Entries written since the index existed win over the old manifest
+            conn.executemany(
+                "INSERT OR IGNORE INTO clips (scene_index, hash, path) VALUES (?, ?, ?)", rows
+            )
+        legacy.replace(legacy.with_name("cache.json.imported"))
+        logger.info("Imported %d clip cache entries from %s", len(rows), legacy)
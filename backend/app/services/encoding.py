@@ -0,0 +1,159 @@
+"""Named libx264 encoder profiles and their per-machine calibration.
+
+A profile fixes everything that trades render speed against quality: x264
+preset and CRF, output size, frame rate and encoder threads. ``standard``
+matches the encoder defaults the renderers always used; ``draft`` is for
+quickly checking a script, ``archival`` for the final copy.
+
+Calibrate once per machine to record how fast each profile encodes here:
+
+    python -m app.services.encoding [--seconds 10]
+"""
+import argparse
+import json
+import os
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    name: str
+    preset: str
+    crf: int
+    width: int
+    height: int
+    fps: int
+    threads: int = 0  # 0 = the renderer splits the cores between its encoders
+
+    @property
+    def size(self) -> str:
+        return f"{self.width}x{self.height}"
+
+    @property
+    def scale(self) -> str:
+        return f"scale={self.width}:{self.height}"
+
+    @property
+    def fit(self) -> str:
+        """Scale into the frame keeping the aspect ratio, padding the rest black."""
+        w, h = self.width, self.height
+        return (
+            f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
+            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,setsar=1"
+        )
+
+    @property
+    def key(self) -> str:
+        """Everything that changes the encoded bytes (the name doesn't)."""
+        return f"{self.preset}|crf{self.crf}|{self.size}|{self.fps}fps"
+
+    def video_args(self, threads: int = 0) -> list[str]:
+        """libx264 output options; ``threads`` applies if the profile doesn't pin them."""
+        args = [
+            "-c:v", "libx264",
+            "-preset", self.preset,
+            "-crf", str(self.crf),
+            "-pix_fmt", "yuv420p",
+            "-r", str(self.fps),
+        ]
+        if self.threads or threads:
+            args += ["-threads", str(self.threads or threads)]
+        return args
+
+
+PROFILES = {
+    "draft": EncoderProfile("draft", preset="ultrafast", crf=30, width=854, height=480, fps=24),
+    "standard": EncoderProfile("standard", preset="medium", crf=23, width=1280, height=720, fps=30),
+    "archival": EncoderProfile("archival", preset="slow", crf=18, width=1280, height=720, fps=30),
+}
+
+
+# Throwaway first render so script mistakes show up within seconds; not
+# selectable per request
+PREVIEW_PROFILE = EncoderProfile("preview", preset="ultrafast", crf=32, width=426, height=240, fps=12)
+
+
+def get_profile(name: str | None = None) -> EncoderProfile:
+    """Look up a profile by name; ``None`` means ``settings.ENCODER_PROFILE``."""
+    name = name or settings.ENCODER_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown encoder profile '{name}'; choose from {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+def calibration_path() -> Path:
+    return settings.storage_dir / "encoder_calibration.json"
+
+
+def load_calibration() -> dict[str, float]:
+    """Real-time factor (media seconds encoded per wall second) per profile
+    from the last calibration; empty if this machine was never calibrated."""
+    try:
+        data = json.loads(calibration_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    return {name: entry["realtime_factor"] for name, entry in data.get("profiles", {}).items()}
+
+
+def list_profiles() -> list[dict]:
+    """Profiles with their calibrated real-time factor (None if uncalibrated)."""
+    factors = load_calibration()
+    return [
+        {**asdict(profile), "realtime_factor": factors.get(name)}
+        for name, profile in PROFILES.items()
+    ]
+
+
+def estimate_seconds(profile: EncoderProfile, media_seconds: float) -> float | None:
+    """Expected encode time from the calibration, or None if uncalibrated."""
+    rtf = load_calibration().get(profile.name)
+    return media_seconds / rtf if rtf else None
+
+
+def _measure(profile: EncoderProfile, seconds: int) -> float:
+    """Encode a synthetic test pattern with narration-like audio; returns the real-time factor."""
+    cmd = [
+        "ffmpeg", "-y", "-v", "error",
+        "-f", "lavfi", "-i", f"testsrc2=size=1280x720:rate=30:duration={seconds}",
+        "-f", "lavfi", "-i", f"sine=frequency=440:duration={seconds}",
+        "-vf", profile.scale,
+        *profile.video_args(),
+        "-c:a", "aac", "-b:a", "128k",
+        "-f", "null", "-",
+    ]
+    start = time.perf_counter()
+    subprocess.run(cmd, check=True, capture_output=True)
+    return seconds / (time.perf_counter() - start)
+
+
+def calibrate(seconds: int = 10) -> dict[str, float]:
+    """Measure every profile on this machine and save the results."""
+    factors = {name: round(_measure(profile, seconds), 3) for name, profile in PROFILES.items()}
+    calibration_path().write_text(json.dumps({
+        "measured_at": datetime.now(timezone.utc).isoformat(),
+        "cpu_count": os.cpu_count(),
+        "sample_seconds": seconds,
+        "profiles": {name: {"realtime_factor": rtf} for name, rtf in factors.items()},
+    }, indent=2))
+    return factors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure each encoder profile's real-time factor.")
+    parser.add_argument("--seconds", type=int, default=10, help="length of the test encode")
+    args = parser.parse_args()
+
+    factors = calibrate(args.seconds)
+    for name, rtf in factors.items():
+        print(f"{name:<10} {PROFILES[name].size:>9} {rtf:>7.2f}x real time")
+    print(f"Saved to {calibration_path()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Shared executors for blocking work called from async services.
+
+CPU-heavy work (slide drawing, PNG encoding) goes to a process pool so it
+neither blocks the event loop nor contends for the GIL; blocking file I/O
+goes to a thread pool. Pools are created lazily and sized from Settings.
+Functions sent to the process pool must be module-level and take picklable
+arguments.
+"""
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_pools: dict[str, Executor] = {}
+_in_flight = {"cpu": 0, "io": 0}
+
+
+def _workers(kind: str) -> int:
+    if kind == "cpu":
+        return max(1, settings.CPU_WORKERS or os.cpu_count() or 1)
+    return max(1, settings.IO_WORKERS)
+
+
+def _pool(kind: str) -> Executor:
+    if kind not in _pools:
+        if kind == "cpu":
+            # spawn: forking a process that runs an event loop and DB threads is unsafe
+            _pools[kind] = ProcessPoolExecutor(
+                max_workers=_workers(kind), mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            _pools[kind] = ThreadPoolExecutor(
+                max_workers=_workers(kind), thread_name_prefix="studyscenes-io"
+            )
+    return _pools[kind]
+
+
+async def _run(kind: str, fn: Callable[..., T], *args, **kwargs) -> T:
+    loop = asyncio.get_running_loop()
+    _in_flight[kind] += 1
+    try:
+        return await loop.run_in_executor(_pool(kind), partial(fn, *args, **kwargs))
+    finally:
+        _in_flight[kind] -= 1
+
+
+async def run_cpu(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run CPU-bound ``fn`` in the process pool."""
+    return await _run("cpu", fn, *args, **kwargs)
+
+
+async def run_io(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run blocking I/O ``fn`` in the thread pool."""
+    return await _run("io", fn, *args, **kwargs)
+
+
+def stats() -> dict:
+    """Per-pool size, in-flight calls and queue depth (calls waiting for a worker)."""
+    result = {}
+    for kind, in_flight in _in_flight.items():
+        workers = _workers(kind)
+        result[kind] = {
+            "workers": workers,
+            "in_flight": in_flight,
+            "queued": max(0, in_flight - workers),
+        }
+    return result
+
+
+def shutdown() -> None:
+    for pool in _pools.values():
+        pool.shutdown(wait=True, cancel_futures=True)
+    _pools.clear()
@@ -5,6 +5,7 @@ from app.services.base.voice import VoiceServiceBase
 from app.services.base.image import ImageServiceBase
 from app.services.base.video import VideoServiceBase
 from app.services.base.video_clip import VideoClipServiceBase
+from app.services.encoding import EncoderProfile
 
 
 def get_outline_service() -> OutlineServiceBase:
@@ -41,6 +42,9 @@ def get_video_clip_service() -> VideoClipServiceBase:
     return MockVideoClipService()
 
 
-def get_video_service() -> VideoServiceBase:
+def get_video_service(profile: EncoderProfile | None = None) -> VideoServiceBase:
+    if settings.VIDEO_RENDERER == "filtergraph":
+        from app.services.video_graph import FilterGraphVideoService
+        return FilterGraphVideoService(profile=profile)
     from app.services.video import FFmpegVideoService
-    return FFmpegVideoService()
+    return FFmpegVideoService(profile=profile)
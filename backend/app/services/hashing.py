@@ -0,0 +1,14 @@
+import hashlib
+from pathlib import Path
+
+
+def content_hash(*parts: object) -> str:
+    """Short stable hash of generation inputs, used as a cache/checkpoint key."""
+    key = "|".join("" if p is None else str(p) for p in parts)
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def file_hash(path: Path) -> str:
+    """Short hash of a file's bytes."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:16]
@@ -0,0 +1,248 @@
+"""Durable job queue backed by the ``jobs`` table.
+
+The API enqueues jobs; ``app.worker`` processes claim them under a lease that
+they keep renewing with heartbeats. A job whose lease expires (worker crash or
+restart) becomes claimable again, and failed jobs are retried with backoff
+until ``max_attempts`` is reached, unless the failure can never succeed.
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Which job kinds report progress for each stage shown in the API
+STAGE_KINDS = {
+    "assets": ("assets", "scene_assets", "all"),
+    "video": ("video", "all"),
+}
+
+ACTIVE_STATUSES = ("pending", "in_progress")
+
+
+class JobReporter:
+    """Collects the latest per-stage status of a running job.
+
+    Updates are cheap in-memory writes so they can be made from many
+    concurrent scene tasks; the worker persists the snapshot with each
+    heartbeat and once more when the job finishes.
+    """
+
+    def __init__(self, job_id: str | None = None) -> None:
+        self.job_id = job_id
+        self.stages: dict[str, dict] = {}
+
+    def update(self, stage: str, status: dict) -> None:
+        self.stages[stage] = status
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _claimable(now: datetime):
+    return or_(
+        and_(Job.status == "pending", Job.available_at <= now),
+        and_(
+            Job.status == "in_progress",
+            Job.lease_expires_at < now,
+            Job.attempts < Job.max_attempts,
+        ),
+    )
+
+
+async def enqueue(
+    db: AsyncSession, project_id: str, kind: str, payload: dict | None = None
+) -> Job:
+    """Queue a job, reusing an active job of the same kind and payload."""
+    result = await db.execute(
+        select(Job)
+        .where(
+            Job.project_id == project_id,
+            Job.kind == kind,
+            Job.status.in_(ACTIVE_STATUSES),
+        )
+        .order_by(Job.created_at.desc())
+    )
+    for existing in result.scalars().all():
+        if (existing.payload or None) == (payload or None):
+            return existing
+
+    job = Job(
+        project_id=project_id,
+        kind=kind,
+        payload=payload,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+    )
+    db.add(job)
+    await db.commit()
+    return job
+
+
+async def latest_job(db: AsyncSession, project_id: str, kinds: tuple[str, ...]) -> Job | None:
+    result = await db.execute(
+        select(Job)
+        .where(Job.project_id == project_id, Job.kind.in_(kinds))
+        .order_by(Job.created_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_stage_status(db: AsyncSession, project_id: str, stage: str) -> dict:
+    """Status dict for the asset/video status endpoints, read from the job table."""
+    default = {"status": "pending", "progress": 0.0, "message": "Not started"}
+    if stage == "video":
+        default.update(video_path=None, preview_path=None)
+
+    job = await latest_job(db, project_id, STAGE_KINDS[stage])
+    if job is None:
+        return default
+
+    if job.status == "pending":
+        message = "Queued" if job.attempts == 0 else (
+            f"Retrying (attempt {job.attempts + 1}/{job.max_attempts}): {job.message}"
+        )
+        return {**default, "message": message}
+
+    status = {**default, **(job.stages or {}).get(stage, {})}
+    if job.status == "in_progress" and status["status"] == "pending":
+        status.update(status="in_progress", message="Starting...")
+    elif job.status == "failed" and status["status"] != "failed":
+        status.update(status="failed", message=job.message)
+    return status
+
+
+async def executor_stats(db: AsyncSession) -> list[dict]:
+    """Executor pool stats last reported by each worker that is running a job."""
+    result = await db.execute(
+        select(Job).where(Job.status == "in_progress").order_by(Job.updated_at.desc())
+    )
+    return [
+        {
+            "worker_id": job.worker_id,
+            "job_id": job.id,
+            "reported_at": job.updated_at,
+            "pools": job.stages["executors"],
+        }
+        for job in result.scalars().all()
+        if job.stages and "executors" in job.stages
+    ]
+
+
+async def claim_next(worker_id: str) -> Job | None:
+    """Atomically take the oldest runnable job and lease it to ``worker_id``."""
+    async with async_session() as db:
+        now = _utcnow()
+
+        # Jobs abandoned on their last attempt will never be picked up again
+        await db.execute(
+            update(Job)
+            .where(
+                Job.status == "in_progress",
+                Job.lease_expires_at < now,
+                Job.attempts >= Job.max_attempts,
+            )
+            .values(status="failed", message="Worker lease expired", updated_at=now)
+        )
+        await db.commit()
+
+        while True:
+            job_id = (await db.execute(
+                select(Job.id).where(_claimable(now)).order_by(Job.created_at).limit(1)
+            )).scalar_one_or_none()
+            if job_id is None:
+                return None
+
+            claimed = await db.execute(
+                update(Job)
+                .where(Job.id == job_id, _claimable(now))
+                .values(
+                    status="in_progress",
+                    worker_id=worker_id,
+                    attempts=Job.attempts + 1,
+                    stages=None,
+                    lease_expires_at=now + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+                    updated_at=now,
+                )
+            )
+            await db.commit()
+            if claimed.rowcount == 1:
+                return await db.get(Job, job_id, populate_existing=True)
+            # Another worker won the race; try the next candidate
+
+
+async def heartbeat(job_id: str, worker_id: str, stages: dict) -> bool:
+    """Extend the lease and persist progress. False if the lease was lost."""
+    now = _utcnow()
+    async with async_session() as db:
+        result = await db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.worker_id == worker_id, Job.status == "in_progress")
+            .values(
+                stages=dict(stages),
+                lease_expires_at=now + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+                updated_at=now,
+            )
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+
+async def complete(job_id: str, worker_id: str, result: dict | None, stages: dict) -> None:
+    now = _utcnow()
+    async with async_session() as db:
+        await db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.worker_id == worker_id)
+            .values(
+                status="completed",
+                result=result,
+                stages=dict(stages),
+                message="",
+                lease_expires_at=None,
+                updated_at=now,
+            )
+        )
+        await db.commit()
+
+
+async def fail(
+    job_id: str, worker_id: str, error: str, stages: dict, retry: bool = True
+) -> None:
+    """Record a failed attempt, rescheduling the job if attempts remain.
+
+    ``retry=False`` fails the job outright, for errors that would only
+    repeat (a project in the wrong state, an unknown job kind).
+    """
+    now = _utcnow()
+    async with async_session() as db:
+        job = await db.get(Job, job_id)
+        if job is None or job.worker_id != worker_id:
+            return
+
+        job.stages = dict(stages)
+        job.message = error
+        job.lease_expires_at = None
+        if retry and job.attempts < job.max_attempts:
+            delay = settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+            job.status = "pending"
+            job.available_at = now + timedelta(seconds=delay)
+            logger.warning(
+                "Job %s (%s) failed on attempt %d/%d, retrying in %ds: %s",
+                job.id, job.kind, job.attempts, job.max_attempts, delay, error,
+            )
+        else:
+            job.status = "failed"
+            logger.error(
+                "Job %s (%s) failed %s: %s", job.id, job.kind,
+                f"after {job.attempts} attempts" if retry else "and will not be retried",
+                error,
+            )
+        await db.commit()
@@ -1,11 +1,16 @@
+import io
 import logging
 import re
 import textwrap
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
 
 from app.services.base.image import ImageServiceBase
+from app.services.executors import run_cpu, run_io
+from app.services.hashing import content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,9 @@ COLORS = [
     (233, 30, 99),    # Pink
 ]
 
+FONT_PATH = "/System/Library/Fonts/Helvetica.ttc"
+RENDER_CACHE_SIZE = 128  # slides kept as PNG bytes (~50 KB each)
+
 WIDTH, HEIGHT = 1280, 720
 MARGIN_X = 80
 MAX_TEXT_W = WIDTH - 2 * MARGIN_X
@@ -108,9 +116,134 @@ def _build_bullets(
     return bullets, source
 
 
-class MockImageService(ImageServiceBase):
-    _color_index = 0
+@lru_cache(maxsize=None)
+def _font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load the slide font once per size for the whole process."""
+    try:
+        return ImageFont.truetype(FONT_PATH, size)
+    except (OSError, IOError):
+        return ImageFont.load_default()
+
+
+def _slide_color(scene_title: str) -> tuple[int, int, int]:
+    """Background color picked from the title, so a slide always renders the same."""
+    return COLORS[int(content_hash(scene_title), 16) % len(COLORS)]
+
+
+def _draw_slide(
+    scene_title: str, bullets: tuple[str, ...], raw: bool = False
+) -> tuple[bytes, int]:
+    """Render a slide. Returns (image bytes, number of bullets drawn).
+
+    The bytes are a PNG, or with ``raw`` an uncompressed WIDTHxHEIGHT RGB24
+    frame for piping straight into ffmpeg. Pure and CPU-bound; runs in the
+    rendering process pool.
+    """
+    img = Image.new("RGB", (WIDTH, HEIGHT), _slide_color(scene_title))
+    draw = ImageDraw.Draw(img)
+
+    bullet_size = 28
+    title_font = _font(44)
+    bullet_font = _font(bullet_size)
+    small_font = _font(20)
+
+    # --- Title (centered, wrapped) ---
+    wrapped_title = textwrap.fill(scene_title, width=40)
+    title_bbox = draw.textbbox((0, 0), wrapped_title, font=title_font)
+    title_w = title_bbox[2] - title_bbox[0]
+    title_h = title_bbox[3] - title_bbox[1]
+    title_y = 50
+    draw.text(
+        ((WIDTH - title_w) / 2, title_y),
+        wrapped_title,
+        fill="white",
+        font=title_font,
+    )
+
+    # --- Divider line ---
+    div_y = title_y + title_h + 24
+    draw.line(
+        [(MARGIN_X, div_y), (WIDTH - MARGIN_X, div_y)],
+        fill=(255, 255, 255, 180),
+        width=2,
+    )
+
+    # --- Bullets ---
+    bullet_y = div_y + 20
+    line_spacing = 42
+    bottom_safe = HEIGHT - 50
+
+    rendered_count = 0
+    for bullet_text in bullets:
+        wrapped = textwrap.fill(f"\u2022  {bullet_text}", width=55)
+        line_count = wrapped.count("\n") + 1
+        needed = line_count * line_spacing
+
+        if bullet_y + needed > bottom_safe:
+            # Try smaller font as last resort
+            if bullet_size > 22:
+                bullet_size = 22
+                line_spacing = 34
+                bullet_font = _font(bullet_size)
+                # Recheck with smaller font
+                wrapped = textwrap.fill(f"\u2022  {bullet_text}", width=65)
+                line_count = wrapped.count("\n") + 1
+                needed = line_count * line_spacing
+                if bullet_y + needed > bottom_safe:
+                    break
+            else:
+                break
+
+        draw.text(
+            (MARGIN_X + 10, bullet_y),
+            wrapped,
+            fill="white",
+            font=bullet_font,
+        )
+        bullet_y += needed
+        rendered_count += 1
+
+    # --- MOCK watermark ---
+    draw.text(
+        (WIDTH - 120, HEIGHT - 40),
+        "MOCK",
+        fill=(255, 255, 255, 100),
+        font=small_font,
+    )
+
+    if raw:
+        return img.tobytes(), rendered_count
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue(), rendered_count
+
+
+_slides: OrderedDict[tuple[str, tuple[str, ...]], tuple[bytes, int]] = OrderedDict()
+
+
+async def _render_slide(
+    scene_title: str, bullets: tuple[str, ...], raw: bool = False
+) -> tuple[bytes, int]:
+    """Render a slide, reusing the PNG if this process has drawn it before.
+
+    Cached on (title, bullets); the slide size is fixed, so identical slides
+    are only drawn and encoded once. Raw frames (~2.7 MB each) are not
+    cached: each feeds one clip encode, whose result the asset cache keeps.
+    """
+    if raw:
+        return await run_cpu(_draw_slide, scene_title, bullets, True)
+    key = (scene_title, bullets)
+    if key in _slides:
+        _slides.move_to_end(key)
+        return _slides[key]
+    result = await run_cpu(_draw_slide, scene_title, bullets)
+    _slides[key] = result
+    if len(_slides) > RENDER_CACHE_SIZE:
+        _slides.popitem(last=False)
+    return result
 
+
+class MockImageService(ImageServiceBase):
     async def generate(
         self,
         scene_title: str,
@@ -120,98 +253,26 @@ class MockImageService(ImageServiceBase):
         narration: str = "",
         key_points: list[str] | None = None,
     ) -> None:
-        bg_color = COLORS[MockImageService._color_index % len(COLORS)]
-        MockImageService._color_index += 1
-
-        img = Image.new("RGB", (WIDTH, HEIGHT), bg_color)
-        draw = ImageDraw.Draw(img)
-
-        title_size = 44
-        bullet_size = 28
-        small_size = 20
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", title_size)
-            bullet_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", bullet_size)
-            small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", small_size)
-        except (OSError, IOError):
-            title_font = ImageFont.load_default()
-            bullet_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
-
-        # --- Title (centered, wrapped) ---
-        wrapped_title = textwrap.fill(scene_title, width=40)
-        title_bbox = draw.textbbox((0, 0), wrapped_title, font=title_font)
-        title_w = title_bbox[2] - title_bbox[0]
-        title_h = title_bbox[3] - title_bbox[1]
-        title_y = 50
-        draw.text(
-            ((WIDTH - title_w) / 2, title_y),
-            wrapped_title,
-            fill="white",
-            font=title_font,
-        )
-
-        # --- Divider line ---
-        div_y = title_y + title_h + 24
-        draw.line(
-            [(MARGIN_X, div_y), (WIDTH - MARGIN_X, div_y)],
-            fill=(255, 255, 255, 180),
-            width=2,
-        )
-
-        # --- Bullets ---
         bullets, source = _build_bullets(key_points, narration, visual_desc)
-        bullet_y = div_y + 20
-        line_spacing = 42
-        bottom_safe = HEIGHT - 50
-
-        rendered_count = 0
-        for bullet_text in bullets:
-            wrapped = textwrap.fill(f"\u2022  {bullet_text}", width=55)
-            line_count = wrapped.count("\n") + 1
-            needed = line_count * line_spacing
-
-            if bullet_y + needed > bottom_safe:
-                # Try smaller font as last resort
-                if bullet_size > 22:
-                    bullet_size = 22
-                    line_spacing = 34
-                    try:
-                        bullet_font = ImageFont.truetype(
-                            "/System/Library/Fonts/Helvetica.ttc", bullet_size
-                        )
-                    except (OSError, IOError):
-                        pass
-                    # Recheck with smaller font
-                    wrapped = textwrap.fill(f"\u2022  {bullet_text}", width=65)
-                    line_count = wrapped.count("\n") + 1
-                    needed = line_count * line_spacing
-                    if bullet_y + needed > bottom_safe:
-                        break
-                else:
-                    break
-
-            draw.text(
-                (MARGIN_X + 10, bullet_y),
-                wrapped,
-                fill="white",
-                font=bullet_font,
-            )
-            bullet_y += needed
-            rendered_count += 1
-
-        # --- MOCK watermark ---
-        draw.text(
-            (WIDTH - 120, HEIGHT - 40),
-            "MOCK",
-            fill=(255, 255, 255, 100),
-            font=small_font,
-        )
+        png, rendered_count = await _render_slide(scene_title, tuple(bullets))
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(str(output_path), "PNG")
+        await run_io(output_path.write_bytes, png)
 
         logger.info(
             "MockImage: '%s' — %d bullets (source=%s)",
             scene_title, rendered_count, source,
         )
+
+    async def render_frame(
+        self,
+        scene_title: str,
+        visual_desc: str,
+        *,
+        narration: str = "",
+        key_points: list[str] | None = None,
+    ) -> bytes:
+        """Render the slide as a raw RGB24 frame (WIDTH x HEIGHT) without touching disk."""
+        bullets, _ = _build_bullets(key_points, narration, visual_desc)
+        frame, _ = await _render_slide(scene_title, tuple(bullets), raw=True)
+        return frame
@@ -1,13 +1,43 @@
-import asyncio
 import logging
-import tempfile
 from pathlib import Path
 
 from app.services.base.video_clip import VideoClipServiceBase
-from app.services.mock.image import MockImageService
+from app.services.encoding import EncoderProfile
+from app.services.mock.image import HEIGHT, WIDTH, MockImageService
+from app.services.video import run_ffmpeg
 
 logger = logging.getLogger(__name__)
 
+# The clip is an intermediate that is re-encoded when muxed with narration,
+# so favour encode speed: ultrafast is ~3.5x quicker than the default preset
+# here at >57 dB PSNR against it. It is a source asset like a Runway clip,
+# so it keeps the slide size whatever profile the final video uses.
+KEN_BURNS_PROFILE = EncoderProfile(
+    "ken_burns", preset="ultrafast", crf=23, width=WIDTH, height=HEIGHT, fps=30
+)
+
+
+def _ken_burns_cmd(output_path: Path, duration_sec: int) -> list[str]:
+    """Zoom/pan over one raw RGB24 slide frame read from stdin."""
+    profile = KEN_BURNS_PROFILE
+    total_frames = duration_sec * profile.fps
+    vf = (
+        f"zoompan="
+        f"z='1+0.3*on/{total_frames}':"
+        f"x='iw/2-(iw/zoom/2)+on*0.5':"
+        f"y='ih/2-(ih/zoom/2)+on*0.3':"
+        f"d={total_frames}:s={profile.size}:fps={profile.fps}"
+    )
+    return [
+        "ffmpeg", "-y",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{WIDTH}x{HEIGHT}",
+        "-i", "pipe:0",
+        "-vf", vf,
+        *profile.video_args(),
+        "-t", str(duration_sec),
+        str(output_path),
+    ]
+
 
 class MockVideoClipService(VideoClipServiceBase):
     """Generate a Ken Burns zoom clip from a static mock slide image."""
@@ -26,43 +56,13 @@ class MockVideoClipService(VideoClipServiceBase):
     ) -> None:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate the static slide image to a temp file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            slide_path = Path(tmp.name)
-
+        # The slide goes to ffmpeg as a raw frame: no PNG encode/decode or temp file
+        frame = await self._image_svc.render_frame(
+            scene_title, visual_desc, narration=narration
+        )
         try:
-            await self._image_svc.generate(
-                scene_title, visual_desc, slide_path, narration=narration
-            )
-
-            total_frames = duration_sec * 30
-            vf = (
-                f"zoompan="
-                f"z='1+0.3*on/{total_frames}':"
-                f"x='iw/2-(iw/zoom/2)+on*0.5':"
-                f"y='ih/2-(ih/zoom/2)+on*0.3':"
-                f"d={total_frames}:s=1280x720:fps=30"
-            )
-
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", str(slide_path),
-                "-vf", vf,
-                "-c:v", "libx264",
-                "-pix_fmt", "yuv420p",
-                "-t", str(duration_sec),
-                str(output_path),
-            ]
-
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            _, stderr = await proc.communicate()
-            if proc.returncode != 0:
-                raise RuntimeError(f"FFmpeg Ken Burns failed: {stderr.decode()[-500:]}")
+            await run_ffmpeg(_ken_burns_cmd(output_path, duration_sec), stdin=frame)
+        except RuntimeError as exc:
+            raise RuntimeError(f"FFmpeg Ken Burns failed: {exc}") from exc
 
-            logger.info("MockVideoClip: '%s' → %s (%ds)", scene_title, output_path, duration_sec)
-        finally:
-            slide_path.unlink(missing_ok=True)
+        logger.info("MockVideoClip: '%s' → %s (%ds)", scene_title, output_path, duration_sec)
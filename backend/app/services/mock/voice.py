@@ -1,10 +1,12 @@
 import logging
+import math
+import sys
+import wave
+from array import array
 from pathlib import Path
 
-from pydub import AudioSegment
-from pydub.generators import Sine
-
 from app.services.base.voice import VoiceServiceBase
+from app.services.executors import run_io
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,42 @@ BEEP_OFF_MS = 200
 BEEP_CYCLE_MS = BEEP_ON_MS + BEEP_OFF_MS
 GAIN_DB = 9
 
+SAMPLE_RATE = 44100
+SAMPLE_WIDTH = 2  # 16-bit mono
+
+
+def _beep_cycle() -> bytes:
+    """One beep + gap period as 16-bit PCM, computed once per process."""
+    amplitude = 32767 * 10 ** (GAIN_DB / 20)
+    on_frames = SAMPLE_RATE * BEEP_ON_MS // 1000
+    off_frames = SAMPLE_RATE * BEEP_OFF_MS // 1000
+    samples = array("h", (
+        # The gain pushes the sine past full scale; clip to 16-bit as the old synth did
+        max(-32768, min(32767, round(amplitude * math.sin(2 * math.pi * BEEP_FREQ_HZ * n / SAMPLE_RATE))))
+        for n in range(on_frames)
+    ))
+    samples.extend([0] * off_frames)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+_CYCLE = _beep_cycle()
+
+
+def _write_beeps(path: Path, frames: int) -> None:
+    """Tile the precomputed cycle straight into a WAV file."""
+    total_bytes = frames * SAMPLE_WIDTH
+    full_cycles, remainder = divmod(total_bytes, len(_CYCLE))
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(SAMPLE_WIDTH)
+        wf.setframerate(SAMPLE_RATE)
+        wf.setnframes(frames)
+        for _ in range(full_cycles):
+            wf.writeframesraw(_CYCLE)
+        wf.writeframesraw(_CYCLE[:remainder])
+
 
 class MockVoiceService(VoiceServiceBase):
     async def generate_scene(self, narration: str, output_path: Path) -> float:
@@ -21,15 +59,8 @@ class MockVoiceService(VoiceServiceBase):
         duration_sec = max((word_count / 150) * 60, 2.0)
         duration_ms = int(duration_sec * 1000)
 
-        beep = Sine(BEEP_FREQ_HZ).to_audio_segment(duration=BEEP_ON_MS).apply_gain(GAIN_DB)
-        gap = AudioSegment.silent(duration=BEEP_OFF_MS)
-        cycle = beep + gap
-
-        repeats = (duration_ms // BEEP_CYCLE_MS) + 1
-        audio = (cycle * repeats)[:duration_ms]
-
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        audio.export(str(output_path), format="wav")
+        await run_io(_write_beeps, output_path, SAMPLE_RATE * duration_ms // 1000)
 
         logger.info("MockVoice: %.1fs audio written to %s", duration_sec, output_path)
         return duration_sec
@@ -1,5 +1,8 @@
+import asyncio
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,7 +11,8 @@ from sqlalchemy.orm import selectinload
 from app.core.config import settings
 from app.models.project import Project
 from app.models.scene import Scene
-from app.schemas.generation import OutlineResponse, ScriptResponse
+from app.models.outline_cache import OutlineCacheEntry
+from app.schemas.generation import OutlineResponse, ScriptResponse, ScriptScene
 from app.services.factory import (
     get_outline_service,
     get_script_service,
@@ -18,34 +22,46 @@ from app.services.factory import (
     get_video_clip_service,
 )
 from app.services.storage import LocalFileStorage
-from app.services.base.video import SceneInput
+from app.services.base.image import ImageServiceBase
+from app.services.base.video import SceneInput, VideoServiceBase
+from app.services.base.video_clip import VideoClipServiceBase
+from app.services.base.voice import VoiceServiceBase
+from app.services.asset_cache import AssetCache, detach
 from app.services.clip_cache import ClipCache
+from app.services.executors import run_io
+from app.services.encoding import PREVIEW_PROFILE, estimate_seconds, get_profile
+from app.services.hashing import content_hash
+from app.services.rate_limit import RateLimited
+from app.services.jobs import JobReporter
 
 logger = logging.getLogger(__name__)
 
-# In-memory status tracking (sufficient for MVP single-process)
-_asset_status: dict[str, dict] = {}
-_video_status: dict[str, dict] = {}
-
 storage = LocalFileStorage()
 
 
-def get_asset_status(project_id: str) -> dict:
-    return _asset_status.get(project_id, {
-        "status": "pending", "progress": 0.0, "message": "Not started"
-    })
-
+class PreconditionError(ValueError):
+    """The project isn't ready for the requested step; retrying won't help."""
 
-def get_video_status(project_id: str) -> dict:
-    return _video_status.get(project_id, {
-        "status": "pending", "progress": 0.0, "video_path": None, "message": "Not started"
-    })
 
+async def generate_outline(
+    project_id: str, db: AsyncSession, bypass_cache: bool = False
+) -> OutlineResponse:
+    """Generate the project's outline, reusing a cached one for identical input.
 
-async def generate_outline(project_id: str, db: AsyncSession) -> OutlineResponse:
+    ``bypass_cache`` forces a fresh generation (e.g. to get a new variation),
+    which then replaces the cached outline.
+    """
     project = await _get_project(project_id, db)
     svc = get_outline_service()
-    outline = await svc.generate(project.content)
+    key = svc.cache_key(project.content)
+
+    cached = None if bypass_cache else await db.get(OutlineCacheEntry, key)
+    if cached:
+        logger.info("Outline cache hit for project %s", project_id)
+        outline = OutlineResponse(**cached.outline)
+    else:
+        outline = await svc.generate(project.content)
+        await db.merge(OutlineCacheEntry(key=key, outline=outline.model_dump()))
 
     project.outline = outline.model_dump()
     project.status = "outline_ready"
@@ -63,7 +79,7 @@ async def save_outline(project_id: str, outline: OutlineResponse, db: AsyncSessi
 async def generate_script(project_id: str, db: AsyncSession) -> ScriptResponse:
     project = await _get_project(project_id, db)
     if not project.outline:
-        raise ValueError("Outline must be generated first")
+        raise PreconditionError("Outline must be generated first")
 
     svc = get_script_service()
     outline = OutlineResponse(**project.outline)
@@ -86,118 +102,441 @@ async def save_script(project_id: str, script: ScriptResponse, db: AsyncSession)
     await db.commit()
 
 
-async def generate_assets(project_id: str, db: AsyncSession) -> None:
+@dataclass
+class _AssetLimits:
+    """Per-kind concurrency limits for asset generation."""
+    clip: asyncio.Semaphore
+    image: asyncio.Semaphore
+    voice: asyncio.Semaphore
+
+    @classmethod
+    def from_settings(cls, clip_svc: VideoClipServiceBase) -> "_AssetLimits":
+        clips = clip_svc.max_in_flight or settings.CLIP_CONCURRENCY
+        return cls(
+            clip=asyncio.Semaphore(max(1, clips)),
+            image=asyncio.Semaphore(max(1, settings.IMAGE_CONCURRENCY)),
+            voice=asyncio.Semaphore(max(1, settings.TTS_CONCURRENCY)),
+        )
+
+
+@dataclass
+class _AssetRun:
+    """Shared state for one generate_assets call."""
+    project_id: str
+    project: Project
+    db: AsyncSession
+    outline: OutlineResponse | None
+    scene_count: int
+    clip_svc: VideoClipServiceBase
+    image_svc: ImageServiceBase
+    voice_svc: VoiceServiceBase
+    cache: ClipCache
+    assets: AssetCache | None
+    limits: _AssetLimits
+    reporter: JobReporter
+    on_scene_ready: Callable[[int, SceneInput], None] | None = None
+    forced: set[int] = field(default_factory=set)
+    # Clip seconds each scene may spend on a new clip, reserved up front
+    clip_allowance: dict[int, int] = field(default_factory=dict)
+    visuals_done: int = 0
+    audio_done: int = 0
+    db_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def done(self) -> int:
+        return self.visuals_done + self.audio_done
+
+    @property
+    def progress(self) -> float:
+        return self.done / (self.scene_count * 2) if self.scene_count else 1.0
+
+    def scene(self, i: int) -> Scene | None:
+        return self.project.scenes[i] if i < len(self.project.scenes) else None
+
+    async def checkpoint(self, i: int, **fields) -> None:
+        """Apply finished-asset fields to scene ``i`` and commit right away.
+
+        All ORM writes go through here under one lock, so concurrent scene
+        tasks never mutate the session while another commit is flushing.
+        """
+        async with self.db_lock:
+            scene = self.scene(i)
+            if scene is None:
+                return
+            for name, value in fields.items():
+                setattr(scene, name, value)
+            await self.db.commit()
+
+    def report(self, message: str) -> None:
+        self.reporter.update("assets", {
+            "status": "in_progress", "progress": self.progress, "message": message,
+        })
+
+
+async def generate_assets(
+    project_id: str,
+    db: AsyncSession,
+    reporter: JobReporter | None = None,
+    on_scene_ready: Callable[[int, SceneInput], None] | None = None,
+    scene_indices: list[int] | None = None,
+    force: bool = False,
+) -> None:
+    """Generate every scene's visual and audio.
+
+    ``on_scene_ready`` is called with the scene index and its SceneInput as
+    soon as both assets for that scene exist, in completion order.
+    ``scene_indices`` limits the run to those scenes; ``force`` ignores their
+    checkpoints and caches so they are generated afresh.
+    """
+    reporter = reporter or JobReporter()
     project = await _get_project(project_id, db, load_scenes=True)
     if not project.script:
-        raise ValueError("Script must be generated first")
+        raise PreconditionError("Script must be generated first")
 
     script = ScriptResponse(**project.script)
     outline = OutlineResponse(**project.outline) if project.outline else None
-    total_steps = len(script.scenes) * 2  # visual + audio per scene
-    done = 0
+    if scene_indices is None:
+        scene_indices = list(range(len(script.scenes)))
+    elif any(not 0 <= i < len(script.scenes) for i in scene_indices):
+        raise PreconditionError(f"Scene index out of range: {scene_indices}")
+    selected = set(scene_indices)
 
-    _asset_status[project_id] = {
+    reporter.update("assets", {
         "status": "in_progress", "progress": 0.0, "message": "Starting asset generation..."
-    }
+    })
 
+    run: _AssetRun | None = None
     try:
         clip_svc = get_video_clip_service()
-        image_svc = get_image_service()
-        voice_svc = get_voice_service()
-
-        cache = ClipCache(storage.clip_cache_path(project_id))
-        clip_duration = settings.SCENE_CLIP_SECONDS
-        max_clip_scenes = settings.MAX_TOTAL_VIDEO_SECONDS // clip_duration
-
-        for i, scene_data in enumerate(script.scenes):
-            # Resolve outline key_points for this scene (matched by index)
-            key_points = None
-            if outline and i < len(outline.sections):
-                key_points = outline.sections[i].key_points
-
-            # Determine visual path for this scene
-            clip_path = storage.scene_clip_path(project_id, i)
-            img_path = storage.scene_image_path(project_id, i)
-            prompt_hash = ClipCache.compute_hash(
-                scene_data.visual_desc, scene_data.title, clip_duration
-            )
+        run = _AssetRun(
+            project_id=project_id,
+            project=project,
+            db=db,
+            outline=outline,
+            scene_count=len(scene_indices),
+            clip_svc=clip_svc,
+            image_svc=get_image_service(),
+            voice_svc=get_voice_service(),
+            cache=await run_io(ClipCache, storage.clip_cache_path(project_id)),
+            assets=await run_io(AssetCache) if settings.ASSET_CACHE_ENABLED else None,
+            limits=_AssetLimits.from_settings(clip_svc),
+            reporter=reporter,
+            on_scene_ready=on_scene_ready,
+            forced=selected if force else set(),
+        )
+        # Clips kept on other scenes still count against the cost cap
+        budget = settings.MAX_TOTAL_VIDEO_SECONDS - sum(
+            _clip_seconds(run, scene) for scene in project.scenes
+            if scene.order_index not in selected
+        )
+        # Split the budget by scene index before any task starts, so which
+        # scenes get clips doesn't depend on the order concurrent tasks finish
+        for i in sorted(scene_indices):
+            planned = _planned_clip_seconds(run, i, script.scenes[i])
+            if planned <= budget:
+                run.clip_allowance[i] = planned
+                budget -= planned
+
+        if settings.ASSET_CONCURRENCY_ENABLED:
+            tasks = [
+                asyncio.create_task(_generate_scene_assets(run, i, script.scenes[i]))
+                for i in scene_indices
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        else:
+            for i in scene_indices:
+                await _generate_scene_assets(run, i, script.scenes[i])
+
+        # A single-scene run only completes the project if the rest already exist
+        if all(scene.image_path and scene.audio_hash for scene in project.scenes):
+            project.status = "assets_ready"
+        await db.commit()
 
-            visual_path: Path
-            if cache.is_valid(i, prompt_hash, clip_path):
-                # Cache hit — reuse existing clip
-                visual_path = clip_path
-                logger.info("Cache hit for scene %d: %s", i, clip_path)
-            elif i < max_clip_scenes:
-                # Within budget — try clip generation with fallback
-                visual_path = await _generate_clip_with_fallback(
-                    clip_svc, image_svc, scene_data, clip_path, img_path,
-                    clip_duration, key_points,
-                )
-                if visual_path.suffix == ".mp4":
-                    cache.set(i, prompt_hash, clip_path)
-            else:
-                # Over budget — static image only
-                await image_svc.generate(
-                    scene_data.title,
-                    scene_data.visual_desc,
-                    img_path,
-                    narration=scene_data.narration,
-                    key_points=key_points,
-                )
-                visual_path = img_path
+        reporter.update("assets", {
+            "status": "completed", "progress": 1.0, "message": "All assets generated"
+        })
+    except Exception as e:
+        reporter.update("assets", {
+            "status": "failed", "progress": run.progress if run else 0.0, "message": str(e)
+        })
+        raise
 
-            if i < len(project.scenes):
-                project.scenes[i].image_path = f"/storage/{storage.relative_path(visual_path)}"
 
-            done += 1
-            _asset_status[project_id] = {
-                "status": "in_progress",
-                "progress": done / total_steps,
-                "message": f"Generated visual {i + 1}/{len(script.scenes)}",
-            }
+async def regenerate_scene(
+    project_id: str, scene_index: int, db: AsyncSession, reporter: JobReporter | None = None
+) -> None:
+    """Regenerate one scene's visual and narration, ignoring its checkpoints."""
+    await generate_assets(
+        project_id, db, reporter, scene_indices=[scene_index], force=True
+    )
 
-            # Generate per-scene audio
-            audio_path = storage.scene_audio_path(project_id, i)
-            duration = await voice_svc.generate_scene(scene_data.narration, audio_path)
 
-            if i < len(project.scenes):
-                project.scenes[i].duration_sec = duration
+async def _generate_scene_assets(run: _AssetRun, i: int, scene_data: ScriptScene) -> None:
+    """Generate the visual and audio for one scene.
 
-            done += 1
-            _asset_status[project_id] = {
-                "status": "in_progress",
-                "progress": done / total_steps,
-                "message": f"Generated audio {i + 1}/{len(script.scenes)}",
-            }
+    Safe to run concurrently with other scenes: every scene writes to its own
+    index-based paths and only touches ``project.scenes[i]``.
+    """
+    mode = settings.CLIP_DURATION_MODE
+    if mode == "audio_first":
+        # Measure the narration first so the clip is requested at its length
+        duration = await _generate_scene_audio(run, i, scene_data)
+        visual_path = await _generate_scene_visual(
+            run, i, scene_data, _fit_clip_allowance(run, i, duration)
+        )
+    elif mode == "estimate":
+        clip_duration = run.clip_svc.fit_duration(_estimate_duration(scene_data.narration))
+        visual_path, duration = await asyncio.gather(
+            _generate_scene_visual(run, i, scene_data, clip_duration),
+            _generate_scene_audio(run, i, scene_data),
+        )
+    else:
+        visual_path = await _generate_scene_visual(
+            run, i, scene_data, settings.SCENE_CLIP_SECONDS
+        )
+        duration = await _generate_scene_audio(run, i, scene_data)
 
-        project.status = "assets_ready"
-        await db.commit()
+    if run.on_scene_ready:
+        run.on_scene_ready(i, SceneInput(
+            visual_path=visual_path,
+            audio_path=storage.scene_audio_path(run.project_id, i),
+            title=scene_data.title,
+            duration_sec=duration,
+        ))
 
-        _asset_status[project_id] = {
-            "status": "completed", "progress": 1.0, "message": "All assets generated"
-        }
-    except Exception as e:
-        _asset_status[project_id] = {
-            "status": "failed", "progress": done / total_steps, "message": str(e)
-        }
-        raise
+
+async def _generate_scene_visual(
+    run: _AssetRun, i: int, scene_data: ScriptScene, clip_duration: int
+) -> Path:
+    # Resolve outline key_points for this scene (matched by index)
+    key_points = None
+    if run.outline and i < len(run.outline.sections):
+        key_points = run.outline.sections[i].key_points
+
+    visual_key = _visual_key(scene_data, key_points, clip_duration)
+    checkpointed = None if i in run.forced else _checkpointed_visual(run.scene(i), visual_key)
+    if checkpointed:
+        logger.info("Checkpoint hit for scene %d visual: %s", i, checkpointed)
+        run.visuals_done += 1
+        run.report(f"Generated visual {run.visuals_done}/{run.scene_count}")
+        return checkpointed
+
+    # Determine visual path for this scene
+    clip_path = storage.scene_clip_path(run.project_id, i)
+    img_path = storage.scene_image_path(run.project_id, i)
+    prompt_hash = ClipCache.compute_hash(
+        scene_data.visual_desc, scene_data.title, clip_duration
+    )
+
+    clip_key = _clip_key(scene_data, clip_duration)
+
+    visual_path: Path
+    complete = True
+    if i not in run.forced and await run_io(run.cache.is_valid, i, prompt_hash, clip_path):
+        # Cache hit — reuse existing clip
+        visual_path = clip_path
+        logger.info("Cache hit for scene %d: %s", i, clip_path)
+    elif await _fetch_cached(run, i, "clip", clip_key, clip_path) is not None:
+        # Same clip was generated before (any project) — no generation cost
+        visual_path = clip_path
+        await run_io(run.cache.set, i, prompt_hash, clip_path)
+    elif clip_duration <= run.clip_allowance.get(i, 0):
+        # Within budget — try clip generation with fallback
+        visual_path = await _generate_clip_with_fallback(
+            run, i, scene_data, clip_path, img_path, clip_duration, key_points,
+        )
+        if visual_path.suffix == ".mp4":
+            await run_io(run.cache.set, i, prompt_hash, clip_path)
+            await _store_cached(run, "clip", clip_key, clip_path)
+        else:
+            # Degraded result: leave unchecked so a re-run retries the clip
+            complete = False
+    else:
+        # Over budget — static image only
+        visual_path = await _generate_image(run, i, scene_data, img_path, key_points)
+
+    await run.checkpoint(
+        i,
+        image_path=f"/storage/{storage.relative_path(visual_path)}",
+        visual_hash=visual_key if complete else None,
+    )
+
+    run.visuals_done += 1
+    run.report(f"Generated visual {run.visuals_done}/{run.scene_count}")
+    return visual_path
+
+
+async def _generate_scene_audio(run: _AssetRun, i: int, scene_data: ScriptScene) -> float:
+    audio_path = storage.scene_audio_path(run.project_id, i)
+    audio_key = run.voice_svc.cache_key(scene_data.narration)
+    scene = run.scene(i)
+
+    if i not in run.forced and _checkpointed_audio(scene, audio_key, audio_path):
+        logger.info("Checkpoint hit for scene %d audio: %s", i, audio_path)
+        duration = scene.duration_sec
+    else:
+        cached = await _fetch_cached(run, i, "audio", audio_key, audio_path)
+        if cached and cached.get("duration"):
+            duration = cached["duration"]
+        else:
+            detach(audio_path)
+            async with run.limits.voice:
+                duration = await run.voice_svc.generate_scene(scene_data.narration, audio_path)
+            await _store_cached(run, "audio", audio_key, audio_path, {"duration": duration})
+        await run.checkpoint(i, duration_sec=duration, audio_hash=audio_key)
+
+    run.audio_done += 1
+    run.report(f"Generated audio {run.audio_done}/{run.scene_count}")
+    return duration
+
+
+def _planned_clip_seconds(run: _AssetRun, i: int, scene_data: ScriptScene) -> int:
+    """Clip length scene ``i`` will ask for, known before its audio exists."""
+    mode = settings.CLIP_DURATION_MODE
+    if mode == "fixed":
+        return settings.SCENE_CLIP_SECONDS
+    scene = run.scene(i)
+    audio_key = run.voice_svc.cache_key(scene_data.narration)
+    audio_path = storage.scene_audio_path(run.project_id, i)
+    if (
+        mode == "audio_first"
+        and i not in run.forced
+        and _checkpointed_audio(scene, audio_key, audio_path)
+    ):
+        return run.clip_svc.fit_duration(scene.duration_sec)
+    return run.clip_svc.fit_duration(_estimate_duration(scene_data.narration))
+
+
+def _fit_clip_allowance(run: _AssetRun, i: int, seconds: float) -> int:
+    """Clip length covering ``seconds``, shortened to scene ``i``'s allowance
+    when the narration came out longer than estimated (the clip then loops)."""
+    wanted = run.clip_svc.fit_duration(seconds)
+    allowance = run.clip_allowance.get(i, 0)
+    if wanted <= allowance:
+        return wanted
+    valid = run.clip_svc.valid_durations or range(1, allowance + 1)
+    return max((d for d in valid if d <= allowance), default=wanted)
+
+
+def _clip_seconds(run: _AssetRun, scene: Scene) -> int:
+    """Approximate clip budget held by a scene's existing clip visual."""
+    if not scene.image_path or not scene.image_path.endswith(".mp4"):
+        return 0
+    if settings.CLIP_DURATION_MODE == "fixed":
+        return settings.SCENE_CLIP_SECONDS
+    return run.clip_svc.fit_duration(scene.duration_sec)
+
+
+def _visual_key(scene_data: ScriptScene, key_points: list[str] | None, clip_duration: int) -> str:
+    return content_hash(
+        "visual", settings.VIDEO_PROVIDER, scene_data.title, scene_data.visual_desc,
+        scene_data.narration, "\n".join(key_points or []), clip_duration,
+    )
+
+
+def _clip_key(scene_data: ScriptScene, clip_duration: int) -> str:
+    return content_hash(
+        "clip", settings.VIDEO_PROVIDER, scene_data.title, scene_data.visual_desc,
+        scene_data.narration, clip_duration,
+    )
+
+
+def _image_key(scene_data: ScriptScene, key_points: list[str] | None) -> str:
+    return content_hash(
+        "image", scene_data.title, scene_data.visual_desc, scene_data.narration,
+        "\n".join(key_points or []),
+    )
+
+
+def _checkpointed_visual(scene: Scene | None, visual_key: str) -> Path | None:
+    """Path of the scene's visual if its checkpoint matches and the file exists."""
+    if scene is None or scene.visual_hash != visual_key or not scene.image_path:
+        return None
+    path = storage.base / scene.image_path.replace("/storage/", "")
+    return path if path.exists() and path.stat().st_size > 0 else None
+
+
+def _checkpointed_audio(scene: Scene | None, audio_key: str, audio_path: Path) -> bool:
+    return (
+        scene is not None
+        and scene.audio_hash == audio_key
+        and scene.duration_sec > 0
+        and audio_path.exists()
+        and audio_path.stat().st_size > 0
+    )
+
+
+async def _fetch_cached(
+    run: _AssetRun, i: int, kind: str, key: str, dest: Path
+) -> dict | None:
+    """Look ``key`` up in the shared asset cache unless scene ``i`` is forced.
+
+    Cache calls do blocking SQLite work and may copy whole files, so they run
+    on the I/O executor rather than stalling the loop (and its heartbeats).
+    """
+    if run.assets is None or i in run.forced:
+        return None
+    return await run_io(run.assets.fetch, kind, key, dest)
+
+
+async def _store_cached(
+    run: _AssetRun, kind: str, key: str, src: Path, meta: dict | None = None
+) -> None:
+    if run.assets:
+        await run_io(run.assets.store, kind, key, src, meta)
+
+
+async def _generate_image(
+    run: _AssetRun, i: int, scene_data: ScriptScene, img_path: Path,
+    key_points: list[str] | None,
+) -> Path:
+    image_key = _image_key(scene_data, key_points)
+    if await _fetch_cached(run, i, "image", image_key, img_path) is not None:
+        return img_path
+
+    detach(img_path)
+    async with run.limits.image:
+        await run.image_svc.generate(
+            scene_data.title,
+            scene_data.visual_desc,
+            img_path,
+            narration=scene_data.narration,
+            key_points=key_points,
+        )
+    await _store_cached(run, "image", image_key, img_path)
+    return img_path
 
 
 async def _generate_clip_with_fallback(
-    clip_svc, image_svc, scene_data, clip_path, img_path,
-    clip_duration, key_points,
+    run: _AssetRun, i: int, scene_data: ScriptScene, clip_path: Path, img_path: Path,
+    clip_duration: int, key_points: list[str] | None,
 ) -> Path:
     """Try clip generation with 1 retry, fall back to static image on failure."""
+    detach(clip_path)
     for attempt in range(2):
         try:
-            await clip_svc.generate(
-                scene_data.title,
-                scene_data.visual_desc,
-                clip_path,
-                narration=scene_data.narration,
-                duration_sec=clip_duration,
-            )
+            async with run.limits.clip:
+                await run.clip_svc.generate(
+                    scene_data.title,
+                    scene_data.visual_desc,
+                    clip_path,
+                    narration=scene_data.narration,
+                    duration_sec=clip_duration,
+                )
             return clip_path
+        except RateLimited:
+            # Already retried with backoff by the provider limiter
+            logger.warning(
+                "Clip generation for '%s' still throttled, "
+                "falling back to static image.", scene_data.title
+            )
+            break
         except Exception:
             if attempt == 0:
                 logger.warning(
@@ -210,30 +549,83 @@ async def _generate_clip_with_fallback(
                 )
 
     # Fallback to static image
-    await image_svc.generate(
-        scene_data.title,
-        scene_data.visual_desc,
-        img_path,
-        narration=scene_data.narration,
-        key_points=key_points,
-    )
-    return img_path
+    return await _generate_image(run, i, scene_data, img_path, key_points)
+
+
+async def _stitch_atomic(
+    video_svc: VideoServiceBase,
+    scene_inputs: list[SceneInput],
+    output_path: Path,
+    cache_dir: Path,
+) -> None:
+    """Stitch beside ``output_path`` and rename into place, so its URL never
+    serves a half-written video."""
+    partial = output_path.with_name(f".{output_path.stem}.partial{output_path.suffix}")
+    try:
+        await video_svc.stitch(scene_inputs, partial, cache_dir=cache_dir)
+        partial.replace(output_path)
+    finally:
+        partial.unlink(missing_ok=True)
+
 
+async def _render_preview(
+    project_id: str, scene_inputs: list[SceneInput], reporter: JobReporter, message: str
+) -> str | None:
+    """Render the low-res preview and report it while the final render runs.
 
-async def generate_video(project_id: str, db: AsyncSession) -> str:
+    Returns its URL, or None if it failed: the preview is optional, so a
+    failure is only logged.
+    """
+    preview_path = storage.video_preview_path(project_id)
+    try:
+        await _stitch_atomic(
+            get_video_service(PREVIEW_PROFILE), scene_inputs, preview_path,
+            storage.preview_segments_dir(project_id),
+        )
+    except Exception:
+        logger.warning("Preview render failed for project %s", project_id, exc_info=True)
+        return None
+
+    preview_url = f"/storage/{storage.relative_path(preview_path)}"
+    reporter.update("video", {
+        "status": "in_progress", "progress": 0.3, "video_path": None,
+        "preview_path": preview_url, "message": f"Preview ready. {message}",
+    })
+    return preview_url
+
+
+async def generate_video(
+    project_id: str,
+    db: AsyncSession,
+    reporter: JobReporter | None = None,
+    profile: str | None = None,
+) -> str:
+    """Stitch the video with the named encoder profile (default from settings).
+
+    With ``VIDEO_PREVIEW_ENABLED`` a low-res preview is rendered alongside
+    the final video and reported as ``preview_path`` as soon as it exists;
+    the final video then takes its place as ``video_path``. The two share
+    the CPU, so the final render runs a little slower than it would alone
+    but never waits for the preview.
+    """
+    reporter = reporter or JobReporter()
+    encoder = get_profile(profile)
     project = await _get_project(project_id, db, load_scenes=True)
     if project.status not in ("assets_ready", "video_ready"):
-        raise ValueError("Assets must be generated first")
+        raise PreconditionError("Assets must be generated first")
 
-    _video_status[project_id] = {
-        "status": "in_progress", "progress": 0.3, "video_path": None, "message": "Stitching video..."
-    }
+    message = f"Stitching video ({encoder.name})..."
+    eta = estimate_seconds(encoder, sum(s.duration_sec or 0 for s in project.scenes))
+    if eta is not None:
+        message = f"Stitching video ({encoder.name}, about {eta:.0f}s)..."
+    preview: asyncio.Task | None = None
+    preview_url = None
 
     try:
         scene_inputs = []
         for i, scene in enumerate(project.scenes):
             if not scene.image_path:
-                raise ValueError(f"Scene {scene.order_index} missing visual asset")
+                raise PreconditionError(f"Scene {scene.order_index} missing visual asset")
             visual_fs_path = storage.base / scene.image_path.replace("/storage/", "")
             audio_fs_path = storage.scene_audio_path(project_id, i)
             scene_inputs.append(SceneInput(
@@ -243,25 +635,136 @@ async def generate_video(project_id: str, db: AsyncSession) -> str:
                 duration_sec=scene.duration_sec,
             ))
 
+        reporter.update("video", {
+            "status": "in_progress", "progress": 0.1, "video_path": None,
+            "preview_path": None, "message": message,
+        })
+        # A draft render is about as quick as the preview, so skip it then
+        if settings.VIDEO_PREVIEW_ENABLED and encoder.name != "draft":
+            preview = asyncio.create_task(
+                _render_preview(project_id, scene_inputs, reporter, message)
+            )
+
         output_path = storage.video_output_path(project_id)
+        try:
+            await _stitch_atomic(
+                get_video_service(encoder), scene_inputs, output_path,
+                storage.segments_dir(project_id),
+            )
+        except Exception:
+            # A preview that makes it stays watchable even if the final render failed
+            if preview:
+                preview_url = await preview
+            raise
+        finally:
+            if preview and not preview.done():
+                # The final video was ready first (e.g. every segment was cached)
+                preview.cancel()
+                await asyncio.gather(preview, return_exceptions=True)
 
-        video_svc = get_video_service()
-        await video_svc.stitch(scene_inputs, output_path)
+        video_url = f"/storage/{storage.relative_path(output_path)}"
+        project.video_path = video_url
+        project.status = "video_ready"
+        await db.commit()
+
+        # The final video replaces the preview; don't leave the stale file behind
+        storage.video_preview_path(project_id).unlink(missing_ok=True)
+        reporter.update("video", {
+            "status": "completed", "progress": 1.0,
+            "video_path": video_url, "preview_path": None, "message": "Video ready"
+        })
+        return video_url
+    except Exception as e:
+        reporter.update("video", {
+            "status": "failed", "progress": 0.0, "video_path": None,
+            "preview_path": preview_url, "message": str(e)
+        })
+        raise
+
+
+async def generate_all(
+    project_id: str,
+    db: AsyncSession,
+    reporter: JobReporter | None = None,
+    profile: str | None = None,
+) -> str:
+    """Generate assets and the video in one streamed pass.
+
+    Each scene's segment is encoded as soon as its visual and audio exist,
+    overlapping with generation of the remaining scenes, so only the final
+    concat runs after the last scene lands. A single-pass renderer
+    (``renders_segments`` False) encodes the whole video after that instead.
+    """
+    reporter = reporter or JobReporter()
+    video_svc = get_video_service(get_profile(profile))
+    segments_dir = storage.segments_dir(project_id)
+    project = await _get_project(project_id, db)
+    # Tasks start as scenes finish, so progress is measured against the script
+    scene_count = len((project.script or {}).get("scenes", []))
+    segment_tasks: dict[int, asyncio.Task] = {}
+    scene_inputs: dict[int, SceneInput] = {}
+    segments_done = 0
+
+    async def render(index: int, scene_input: SceneInput) -> None:
+        nonlocal segments_done
+        await video_svc.render_segment(scene_input, segments_dir)
+        segments_done += 1
+        reporter.update("video", {
+            "status": "in_progress",
+            "progress": 0.9 * segments_done / max(scene_count, 1),
+            "video_path": None,
+            "message": f"Encoded segment {segments_done}/{scene_count}",
+        })
+
+    def on_scene_ready(index: int, scene_input: SceneInput) -> None:
+        scene_inputs[index] = scene_input
+        if video_svc.renders_segments:
+            segment_tasks[index] = asyncio.create_task(render(index, scene_input))
+
+    reporter.update("video", {
+        "status": "in_progress", "progress": 0.0, "video_path": None,
+        "message": "Waiting for scene assets...",
+    })
+
+    try:
+        try:
+            await generate_assets(project_id, db, reporter, on_scene_ready=on_scene_ready)
+            await asyncio.gather(*segment_tasks.values())
+        except BaseException:
+            for task in segment_tasks.values():
+                task.cancel()
+            await asyncio.gather(*segment_tasks.values(), return_exceptions=True)
+            raise
+
+        reporter.update("video", {
+            "status": "in_progress",
+            "progress": 0.9 if video_svc.renders_segments else 0.0,
+            "video_path": None,
+            "message": "Joining segments..." if video_svc.renders_segments else "Encoding video...",
+        })
+        # Every segment is cached by now, so this only concats (and prunes
+        # segments left over from earlier versions of the script); a
+        # single-pass renderer encodes everything here
+        output_path = storage.video_output_path(project_id)
+        await _stitch_atomic(
+            video_svc, [scene_inputs[i] for i in sorted(scene_inputs)], output_path, segments_dir
+        )
 
+        project = await _get_project(project_id, db)
         video_url = f"/storage/{storage.relative_path(output_path)}"
         project.video_path = video_url
         project.status = "video_ready"
         await db.commit()
 
-        _video_status[project_id] = {
+        reporter.update("video", {
             "status": "completed", "progress": 1.0,
             "video_path": video_url, "message": "Video ready"
-        }
+        })
         return video_url
     except Exception as e:
-        _video_status[project_id] = {
+        reporter.update("video", {
             "status": "failed", "progress": 0.0, "video_path": None, "message": str(e)
-        }
+        })
         raise
 
 
@@ -272,28 +775,90 @@ async def _get_project(project_id: str, db: AsyncSession, load_scenes: bool = Fa
     result = await db.execute(stmt)
     project = result.scalar_one_or_none()
     if not project:
-        raise ValueError(f"Project {project_id} not found")
+        raise PreconditionError(f"Project {project_id} not found")
     return project
 
 
 async def _sync_scenes(project: Project, script: ScriptResponse, db: AsyncSession) -> None:
-    # Delete existing scenes
+    """Diff the script against existing scene rows instead of recreating them.
+
+    Scenes are matched by content, preferring their current position. Matched
+    scenes keep their rows and asset checkpoints (their files follow them if
+    they moved); edited scenes reuse the row at their index with the stale
+    checkpoints cleared; everything else is created or deleted.
+    """
     result = await db.execute(
-        select(Scene).where(Scene.project_id == project.id)
+        select(Scene).where(Scene.project_id == project.id).order_by(Scene.order_index)
     )
-    for old_scene in result.scalars().all():
-        await db.delete(old_scene)
+    old_scenes = list(result.scalars().all())
+
+    unmatched = {s.order_index: s for s in old_scenes}
+    by_content: dict[tuple[str, str, str], list[Scene]] = {}
+    for old in old_scenes:
+        by_content.setdefault(_scene_content(old), []).append(old)
 
-    # Create new scenes
+    matches: dict[int, Scene] = {}
+    # Pass 1: unchanged scenes that stayed in place
     for i, scene_data in enumerate(script.scenes):
-        words = len(scene_data.narration.split())
-        duration = max((words / 150) * 60, 2.0)
-        scene = Scene(
-            project_id=project.id,
-            order_index=i,
-            title=scene_data.title,
-            narration=scene_data.narration,
-            visual_desc=scene_data.visual_desc,
-            duration_sec=duration,
-        )
-        db.add(scene)
+        old = unmatched.get(i)
+        if old and _scene_content(old) == _scene_content(scene_data):
+            matches[i] = unmatched.pop(i)
+    # Pass 2: unchanged scenes that moved
+    for i, scene_data in enumerate(script.scenes):
+        if i in matches:
+            continue
+        for old in by_content.get(_scene_content(scene_data), []):
+            if unmatched.get(old.order_index) is old:
+                matches[i] = unmatched.pop(old.order_index)
+                break
+
+    moves = {old.order_index: i for i, old in matches.items() if old.order_index != i}
+    if moves:
+        storage.move_scene_assets(project.id, moves)
+        clip_cache = await run_io(ClipCache, storage.clip_cache_path(project.id))
+        await run_io(clip_cache.remap, moves)
+
+    sections = OutlineResponse(**project.outline).sections if project.outline else []
+
+    def key_points_at(index: int) -> list[str] | None:
+        return sections[index].key_points if index < len(sections) else None
+
+    for old_index, new_index in moves.items():
+        old = matches[new_index]
+        # Slides pull key_points from the outline section at the same index
+        if key_points_at(old_index) != key_points_at(new_index):
+            old.visual_hash = None
+        if old.image_path:
+            moved_from = storage.base / old.image_path.replace("/storage/", "")
+            moved_to = moved_from.with_name(f"scene_{new_index:03d}{moved_from.suffix}")
+            old.image_path = f"/storage/{storage.relative_path(moved_to)}"
+        old.order_index = new_index
+
+    for i, scene_data in enumerate(script.scenes):
+        if i in matches:
+            continue
+        scene = unmatched.pop(i, None)
+        if scene is None:
+            scene = Scene(project_id=project.id, order_index=i)
+            db.add(scene)
+        if scene.narration != scene_data.narration:
+            scene.audio_hash = None
+            scene.duration_sec = _estimate_duration(scene_data.narration)
+        scene.visual_hash = None
+        scene.title = scene_data.title
+        scene.narration = scene_data.narration
+        scene.visual_desc = scene_data.visual_desc
+        logger.info("Scene %d changed; marked for regeneration", i)
+
+    for leftover in unmatched.values():
+        await db.delete(leftover)
+
+
+def _scene_content(scene: Scene | ScriptScene) -> tuple[str, str, str]:
+    return scene.title, scene.narration, scene.visual_desc
+
+
+def _estimate_duration(narration: str) -> float:
+    """Rough narration length at 150 words per minute."""
+    words = len(narration.split())
+    return max((words / 150) * 60, 2.0)
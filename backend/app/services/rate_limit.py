@@ -0,0 +1,148 @@
+"""Per-provider request pacing shared by every real service in the process.
+
+Each provider gets a token bucket (requests/minute) and an adaptive
+concurrency limit. The limit grows additively while calls succeed and is
+halved whenever the provider answers 429/503, at which point new calls also
+pause for the server's Retry-After (or an exponential backoff) before trying
+again. Scenes running in parallel therefore settle at the highest rate the
+provider sustains instead of hammering it into the static-image fallback.
+"""
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from typing import TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MAX_BACKOFF = 60.0  # seconds
+
+
+class RateLimited(RuntimeError):
+    """The provider rejected a request because of load (HTTP 429/503)."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(headers: Mapping[str, str] | None) -> float | None:
+    """Parse a Retry-After header given as seconds or as an HTTP date."""
+    value = (headers or {}).get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: int) -> None:
+        self.rate = per_minute / 60
+        # Allow up to one second's worth of requests in a burst
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    async def take(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ProviderLimiter:
+    """Token bucket plus AIMD concurrency limit for one provider."""
+
+    def __init__(self, name: str, per_minute: int, max_concurrency: int) -> None:
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self._bucket = _TokenBucket(per_minute) if per_minute > 0 else None
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+        self._resume_at = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one request slot, waiting out pauses and the rate budget."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            while (delay := self._resume_at - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+            if self._bucket:
+                await self._bucket.take()
+            yield
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def on_success(self) -> None:
+        # Additive increase: about +1 slot per limit's worth of successes
+        self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+    def on_throttle(self, retry_after: float | None, attempt: int) -> float:
+        """Halve the concurrency limit and pause new requests. Returns the pause."""
+        # Requests already in flight when the first 429 landed count as one signal
+        if time.monotonic() >= self._resume_at:
+            self.limit = max(1.0, self.limit / 2)
+        delay = retry_after if retry_after is not None else min(
+            MAX_BACKOFF, 2 ** attempt + random.uniform(0, 1)
+        )
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+        logger.warning(
+            "%s throttled; concurrency limit now %d, pausing %.1fs",
+            self.name, int(self.limit), delay,
+        )
+        return delay
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Run ``fn`` under the limiter, retrying while the provider throttles it."""
+        attempts = max(1, settings.PROVIDER_MAX_RETRIES + 1)
+        for attempt in range(attempts):
+            async with self.slot():
+                try:
+                    result = await fn(*args, **kwargs)
+                except RateLimited as exc:
+                    self.on_throttle(exc.retry_after, attempt)
+                    if attempt == attempts - 1:
+                        raise
+                    continue
+                self.on_success()
+                return result
+        raise AssertionError("unreachable")
+
+
+_LIMITS = {
+    "openai": lambda: (settings.OPENAI_RPM, settings.OPENAI_CONCURRENCY),
+    "runway": lambda: (settings.RUNWAY_RPM, settings.RUNWAY_CONCURRENCY),
+}
+_limiters: dict[str, ProviderLimiter] = {}
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    """The process-wide limiter for ``provider`` (``openai`` or ``runway``)."""
+    if provider not in _limiters:
+        per_minute, concurrency = _LIMITS[provider]()
+        _limiters[provider] = ProviderLimiter(provider, per_minute, concurrency)
+    return _limiters[provider]
@@ -0,0 +1,34 @@
+"""Shared OpenAI client setup and rate-limited call helper."""
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import openai
+
+from app.core.config import settings
+from app.services.rate_limit import RateLimited, get_limiter, retry_after_seconds
+
+T = TypeVar("T")
+
+THROTTLE_STATUSES = (429, 503)
+
+
+def make_client() -> openai.AsyncOpenAI:
+    # Retries are handled by the shared limiter so parallel scenes back off together
+    return openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
+
+
+async def _translate(fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+    try:
+        return await fn(*args, **kwargs)
+    except openai.APIStatusError as exc:
+        if exc.status_code in THROTTLE_STATUSES:
+            raise RateLimited(
+                f"OpenAI throttled ({exc.status_code}): {exc.message}",
+                retry_after_seconds(exc.response.headers),
+            ) from exc
+        raise
+
+
+async def openai_call(fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+    """Call an OpenAI client method under the process-wide OpenAI limiter."""
+    return await get_limiter("openai").call(_translate, fn, *args, **kwargs)
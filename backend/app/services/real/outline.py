@@ -1,14 +1,19 @@
 import json
 import logging
 
-from openai import AsyncOpenAI, OpenAIError
+from openai import OpenAIError
 
 from app.core.config import settings
 from app.schemas.generation import OutlineResponse, OutlineSection
 from app.services.base.outline import OutlineServiceBase
+from app.services.hashing import content_hash
+from app.services.real.openai_client import make_client, openai_call
 
 logger = logging.getLogger(__name__)
 
+MODEL = "gpt-4o-mini"
+TEMPERATURE = 0.7
+
 SYSTEM_PROMPT = (
     "You generate structured outlines from study material.\n"
     "Return ONLY valid JSON, no markdown fences, no extra text.\n"
@@ -23,18 +28,22 @@ class RealOutlineService(OutlineServiceBase):
             raise ValueError(
                 "OPENAI_API_KEY is required when USE_MOCK_AI is disabled"
             )
-        self._client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self._client = make_client()
+
+    def cache_key(self, content: str) -> str:
+        return content_hash("outline", "openai", MODEL, TEMPERATURE, SYSTEM_PROMPT, content)
 
     async def generate(self, content: str) -> OutlineResponse:
-        logger.info("Generating outline via OpenAI (model=gpt-4o-mini)")
+        logger.info("Generating outline via OpenAI (model=%s)", MODEL)
         try:
-            response = await self._client.chat.completions.create(
-                model="gpt-4o-mini",
+            response = await openai_call(
+                self._client.chat.completions.create,
+                model=MODEL,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": content},
                 ],
-                temperature=0.7,
+                temperature=TEMPERATURE,
             )
         except OpenAIError as exc:
             logger.error("OpenAI API error: %s", exc)
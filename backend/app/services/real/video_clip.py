@@ -1,28 +1,143 @@
 import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 import httpx
 
 from app.core.config import settings
 from app.services.base.video_clip import VideoClipServiceBase
+from app.services.rate_limit import RateLimited, get_limiter, retry_after_seconds
 
 logger = logging.getLogger(__name__)
 
 API_BASE = "https://api.dev.runwayml.com"
-POLL_INTERVAL = 10  # seconds
 POLL_TIMEOUT = 300  # seconds
+MIN_POLL_INTERVAL = 2.0  # seconds
+MAX_POLL_INTERVAL = 15.0
+EXPECTED_TASK_SECONDS = 60.0  # initial guess until tasks have been observed
 VALID_DURATIONS = (4, 6, 8)
+THROTTLE_STATUSES = (429, 503)
+DOWNLOAD_ATTEMPTS = 4
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class _PendingTask:
+    future: asyncio.Future
+    submitted_at: float
+
+
+class _TaskPoller:
+    """Single loop that polls every outstanding Runway task.
+
+    Instead of one sleeping loop per clip, each cycle checks all pending
+    tasks at once. The wait between cycles follows a running average of
+    observed task durations: long while every task is young, dropping to
+    ``MIN_POLL_INTERVAL`` once one is due.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, _PendingTask] = {}
+        self._headers: dict[str, str] = {}
+        self._task: asyncio.Task | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self.expected_seconds = EXPECTED_TASK_SECONDS
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        """Bounds the tasks submitted and not yet finished (``RUNWAY_MAX_TASKS``)."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, settings.RUNWAY_MAX_TASKS))
+        return self._slots
+
+    def wait(self, task_id: str, headers: dict[str, str]) -> asyncio.Future:
+        """Future resolving to the task's output URL once it succeeds."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[task_id] = _PendingTask(future, time.monotonic())
+        self._headers = headers
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return future
+
+    def _next_interval(self) -> float:
+        now = time.monotonic()
+        remaining = min(
+            self.expected_seconds - (now - p.submitted_at) for p in self._pending.values()
+        )
+        return min(MAX_POLL_INTERVAL, max(MIN_POLL_INTERVAL, remaining))
+
+    def _observe(self, seconds: float) -> None:
+        self.expected_seconds = 0.7 * self.expected_seconds + 0.3 * seconds
+
+    async def _run(self) -> None:
+        async with httpx.AsyncClient(timeout=30) as client:
+            while self._pending:
+                await asyncio.sleep(self._next_interval())
+                await asyncio.gather(*(
+                    self._poll(client, task_id) for task_id in list(self._pending)
+                ))
+            # Mark stopped before closing the client so new tasks start a fresh loop
+            self._task = None
+
+    async def _poll(self, client: httpx.AsyncClient, task_id: str) -> None:
+        pending = self._pending[task_id]
+        if pending.future.done():
+            # Caller went away (cancelled); stop tracking the task
+            del self._pending[task_id]
+            return
+
+        age = time.monotonic() - pending.submitted_at
+        try:
+            resp = await client.get(f"{API_BASE}/v1/tasks/{task_id}", headers=self._headers)
+            if resp.status_code in THROTTLE_STATUSES:
+                # The task keeps running; check again next cycle
+                return
+            if resp.status_code != 200:
+                raise RuntimeError(
+                    f"Runway poll error {resp.status_code}: {resp.text[:500]}"
+                )
+
+            data = resp.json()
+            status = data.get("status")
+            logger.debug("Runway task %s status: %s", task_id, status)
+
+            if status == "SUCCEEDED":
+                self._observe(age)
+                self._resolve(task_id, result=data["output"][0])
+            elif status == "FAILED":
+                raise RuntimeError(f"Runway task failed: {data.get('failure', 'unknown')}")
+            elif age > POLL_TIMEOUT:
+                raise RuntimeError(f"Runway task {task_id} timed out after {POLL_TIMEOUT}s")
+        except Exception as exc:
+            self._resolve(task_id, error=exc)
+
+    def _resolve(self, task_id: str, result: str | None = None, error: Exception | None = None) -> None:
+        pending = self._pending.pop(task_id)
+        if pending.future.done():
+            return
+        if error is not None:
+            pending.future.set_exception(error)
+        else:
+            pending.future.set_result(result)
+
+
+_poller = _TaskPoller()
 
 
 class RunwayVideoClipService(VideoClipServiceBase):
     """Generate video clips via Runway ML text-to-video API."""
 
+    valid_durations = VALID_DURATIONS
+
     def __init__(self) -> None:
         if not settings.RUNWAY_API_KEY:
             raise ValueError(
                 "RUNWAY_API_KEY is required when VIDEO_PROVIDER=runway"
             )
+        self.max_in_flight = max(1, settings.RUNWAY_MAX_TASKS)
         self._headers = {
             "Authorization": f"Bearer {settings.RUNWAY_API_KEY}",
             "X-Runway-Version": "2024-11-06",
@@ -49,7 +164,19 @@ class RunwayVideoClipService(VideoClipServiceBase):
             prompt += f" Context: {narration}"
         prompt = prompt[:1000]
 
-        # Submit task
+        # The limiter paces the create calls only; once Runway has accepted a
+        # task, the shared poller does the waiting
+        async with _poller.slots:
+            task_id = await get_limiter("runway").call(
+                self._submit, scene_title, prompt, clamped
+            )
+            output_url = await _poller.wait(task_id, self._headers)
+        async with httpx.AsyncClient(timeout=httpx.Timeout(30, read=60)) as client:
+            await self._download(client, output_url, output_path)
+        logger.info("Runway clip saved: %s", output_path)
+
+    async def _submit(self, scene_title: str, prompt: str, duration: int) -> str:
+        """Create a generation task and return its ID."""
         async with httpx.AsyncClient(timeout=30) as client:
             resp = await client.post(
                 f"{API_BASE}/v1/text_to_video",
@@ -58,51 +185,82 @@ class RunwayVideoClipService(VideoClipServiceBase):
                     "model": "gen3a_turbo",
                     "promptText": prompt,
                     "ratio": "1280:720",
-                    "duration": clamped,
+                    "duration": duration,
                 },
             )
+            if resp.status_code in THROTTLE_STATUSES:
+                raise RateLimited(
+                    f"Runway throttled ({resp.status_code})",
+                    retry_after_seconds(resp.headers),
+                )
             if resp.status_code != 200:
                 raise RuntimeError(
                     f"Runway API error {resp.status_code}: {resp.text[:500]}"
                 )
             task_id = resp.json()["id"]
             logger.info("Runway task created: %s for '%s'", task_id, scene_title)
+            return task_id
 
-        # Poll for completion
-        elapsed = 0
-        async with httpx.AsyncClient(timeout=30) as client:
-            while elapsed < POLL_TIMEOUT:
-                await asyncio.sleep(POLL_INTERVAL)
-                elapsed += POLL_INTERVAL
-
-                resp = await client.get(
-                    f"{API_BASE}/v1/tasks/{task_id}",
-                    headers=self._headers,
-                )
-                if resp.status_code != 200:
-                    raise RuntimeError(
-                        f"Runway poll error {resp.status_code}: {resp.text[:500]}"
+    async def _download(
+        self, client: httpx.AsyncClient, url: str, output_path: Path
+    ) -> None:
+        """Stream the clip to a ``.part`` file, resuming with Range requests
+        after dropped connections, and move it into place once verified."""
+        part_path = output_path.with_name(output_path.name + ".part")
+        part_path.unlink(missing_ok=True)
+        try:
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                try:
+                    expected = await self._fetch_into(client, url, part_path)
+                    break
+                except httpx.TransportError as exc:
+                    if attempt == DOWNLOAD_ATTEMPTS - 1:
+                        raise RuntimeError(f"Runway download failed: {exc}") from exc
+                    logger.warning(
+                        "Runway download of %s interrupted at %d bytes (%s), resuming",
+                        output_path.name, part_path.stat().st_size if part_path.exists() else 0, exc,
                     )
+                    await asyncio.sleep(2 ** attempt)
 
-                data = resp.json()
-                status = data.get("status")
-                logger.debug("Runway task %s status: %s", task_id, status)
-
-                if status == "SUCCEEDED":
-                    output_url = data["output"][0]
-                    await self._download(client, output_url, output_path)
-                    logger.info("Runway clip saved: %s", output_path)
-                    return
-                elif status == "FAILED":
-                    raise RuntimeError(
-                        f"Runway task failed: {data.get('failure', 'unknown')}"
-                    )
+            _verify_clip(part_path, expected)
+            part_path.replace(output_path)
+        finally:
+            part_path.unlink(missing_ok=True)
 
-        raise RuntimeError(f"Runway task {task_id} timed out after {POLL_TIMEOUT}s")
+    @staticmethod
+    async def _fetch_into(client: httpx.AsyncClient, url: str, part_path: Path) -> int | None:
+        """Append the rest of ``url`` to ``part_path``; returns the full size if known."""
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        async with client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 416:
+                # Nothing left to fetch, or the server lost track; start over
+                part_path.unlink(missing_ok=True)
+                raise httpx.RemoteProtocolError("Range not satisfiable", request=resp.request)
+            resp.raise_for_status()
 
-    async def _download(
-        self, client: httpx.AsyncClient, url: str, output_path: Path
-    ) -> None:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        output_path.write_bytes(resp.content)
+            if resp.status_code == 206:
+                total = resp.headers.get("content-range", "").rpartition("/")[2]
+                expected = int(total) if total.isdigit() else None
+                mode = "ab"
+            else:
+                # Full body: the server ignored the Range header, or first attempt
+                length = resp.headers.get("content-length")
+                expected = int(length) if length and length.isdigit() else None
+                mode = "wb"
+
+            with open(part_path, mode) as f:
+                async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        return expected
+
+
+def _verify_clip(path: Path, expected_size: int | None) -> None:
+    """Reject truncated or non-MP4 downloads before they reach the caches."""
+    size = path.stat().st_size
+    if expected_size is not None and size != expected_size:
+        raise RuntimeError(f"Runway download incomplete: {size} of {expected_size} bytes")
+    with open(path, "rb") as f:
+        head = f.read(12)
+    if len(head) < 12 or head[4:8] != b"ftyp":
+        raise RuntimeError("Runway download is not an MP4 file")
@@ -1,14 +1,26 @@
 import logging
-import wave
+import struct
 from pathlib import Path
 
 import openai
 
 from app.core.config import settings
-from app.services.base.voice import VoiceServiceBase
+from app.services.base.voice import VoiceServiceBase, normalize_narration
+from app.services.hashing import content_hash
+from app.services.real.openai_client import make_client, openai_call
 
 logger = logging.getLogger(__name__)
 
+RESPONSE_FORMATS = ("pcm", "wav")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# OpenAI's raw "pcm" output: 24kHz, 16-bit signed little-endian, mono
+PCM_RATE = 24000
+PCM_CHANNELS = 1
+PCM_SAMPLE_WIDTH = 2
+
+WAV_HEADER_SIZE = 44
+
 
 class RealVoiceService(VoiceServiceBase):
     def __init__(self) -> None:
@@ -17,39 +29,106 @@ class RealVoiceService(VoiceServiceBase):
                 "OPENAI_API_KEY is required for real TTS. "
                 "Set it in .env or switch to USE_MOCK_TTS=true."
             )
-        self._client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        if settings.TTS_FORMAT not in RESPONSE_FORMATS:
+            raise ValueError(f"TTS_FORMAT must be one of {RESPONSE_FORMATS}")
+        self._client = make_client()
+
+    def cache_key(self, narration: str) -> str:
+        return content_hash(
+            "tts", "openai", settings.TTS_MODEL, settings.TTS_VOICE, settings.TTS_FORMAT,
+            normalize_narration(narration),
+        )
 
     async def generate_scene(self, narration: str, output_path: Path) -> float:
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = output_path.with_name(output_path.name + ".part")
 
         try:
-            response = await self._client.audio.speech.create(
-                model="tts-1",
-                voice=settings.TTS_VOICE,
-                input=narration,
-                response_format="wav",
-            )
-        except openai.OpenAIError as exc:
-            raise RuntimeError(f"OpenAI TTS error: {exc}") from exc
-
-        audio_bytes = response.content
-        output_path.write_bytes(audio_bytes)
+            try:
+                duration = await openai_call(
+                    self._stream_speech, normalize_narration(narration), part_path
+                )
+            except openai.OpenAIError as exc:
+                raise RuntimeError(f"OpenAI TTS error: {exc}") from exc
+            part_path.replace(output_path)
+        finally:
+            part_path.unlink(missing_ok=True)
 
-        if not output_path.exists() or output_path.stat().st_size == 0:
-            raise RuntimeError(f"TTS output file is empty or missing: {output_path}")
-
-        duration = self._wav_duration(output_path)
         logger.info("RealVoice: %.1fs audio written to %s", duration, output_path)
         return duration
 
-    @staticmethod
-    def _wav_duration(path: Path) -> float:
-        with wave.open(str(path), "rb") as wf:
-            rate = wf.getframerate()
-            frames = wf.getnframes()
-            # OpenAI TTS sets nframes to INT32_MAX; fall back to file-size math
-            if frames >= 2147483647:
-                data_bytes = path.stat().st_size - 44  # 44-byte WAV header
-                frame_size = wf.getnchannels() * wf.getsampwidth()
-                frames = data_bytes // frame_size
-            return frames / rate
+    async def _stream_speech(self, text: str, path: Path) -> float:
+        """Write the TTS response to ``path`` as it arrives; returns its duration.
+
+        The result is always a WAV file. Raw PCM gets a header written up
+        front, and a streamed WAV has its placeholder sizes fixed up, so the
+        duration comes from the byte count without reading the file back.
+        """
+        fmt = settings.TTS_FORMAT
+        async with self._client.audio.speech.with_streaming_response.create(
+            model=settings.TTS_MODEL,
+            voice=settings.TTS_VOICE,
+            input=text,
+            response_format=fmt,
+        ) as response:
+            with open(path, "wb") as f:
+                if fmt == "pcm":
+                    f.write(_wav_header(PCM_CHANNELS, PCM_RATE, PCM_SAMPLE_WIDTH, 0))
+                    layout = (PCM_CHANNELS, PCM_RATE, PCM_SAMPLE_WIDTH, WAV_HEADER_SIZE)
+                else:
+                    layout = None
+                head = b""
+                async for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+                    if layout is None:
+                        head += chunk
+                        layout = _parse_wav_header(head)
+
+                if layout is None:
+                    raise RuntimeError(f"TTS output is not valid WAV audio: {path}")
+                channels, rate, sample_width, data_offset = layout
+                total = f.tell()
+                data_bytes = total - data_offset
+                if data_bytes <= 0:
+                    raise RuntimeError(f"TTS output file is empty: {path}")
+
+                # OpenAI streams WAV with unknown (0xFFFFFFFF) sizes; record the real ones
+                f.seek(4)
+                f.write(struct.pack("<I", total - 8))
+                f.seek(data_offset - 4)
+                f.write(struct.pack("<I", data_bytes))
+
+        return data_bytes / (rate * channels * sample_width)
+
+
+def _wav_header(channels: int, rate: int, sample_width: int, data_bytes: int) -> bytes:
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_bytes, b"WAVE",
+        b"fmt ", 16, 1, channels, rate, rate * channels * sample_width,
+        channels * sample_width, sample_width * 8,
+        b"data", data_bytes,
+    )
+
+
+def _parse_wav_header(head: bytes) -> tuple[int, int, int, int] | None:
+    """(channels, rate, sample width, data offset), or None until the header is complete."""
+    if len(head) < 12:
+        return None
+    if head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        raise RuntimeError("TTS output is not a WAV stream")
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(head):
+        chunk_id, size = struct.unpack_from("<4sI", head, pos)
+        if chunk_id == b"data":
+            if fmt is None:
+                raise RuntimeError("TTS WAV stream has no fmt chunk before its data")
+            return (*fmt, pos + 8)
+        if chunk_id == b"fmt ":
+            if pos + 24 > len(head):
+                return None
+            _, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", head, pos + 8)
+            fmt = (channels, rate, bits // 8)
+        pos += 8 + size + (size & 1)
+    return None
@@ -6,7 +6,9 @@ from app.core.config import settings
 
 class LocalFileStorage:
     def __init__(self):
-        self.base = settings.storage_dir
+        # Absolute, so paths handed to ffmpeg (e.g. concat lists written in a
+        # temp dir) don't depend on the working directory
+        self.base = settings.storage_dir.resolve()
 
     def project_dir(self, project_id: str) -> Path:
         d = self.base / project_id
@@ -32,13 +34,24 @@ class LocalFileStorage:
         return self.clips_dir(project_id) / f"scene_{index:03d}.mp4"
 
     def clip_cache_path(self, project_id: str) -> Path:
-        return self.clips_dir(project_id) / "cache.json"
+        return self.clips_dir(project_id) / "cache.db"
 
     def video_dir(self, project_id: str) -> Path:
         d = self.project_dir(project_id) / "video"
         d.mkdir(parents=True, exist_ok=True)
         return d
 
+    def segments_dir(self, project_id: str) -> Path:
+        d = self.video_dir(project_id) / "segments"
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+
+    def preview_segments_dir(self, project_id: str) -> Path:
+        # Kept apart from the final segments so neither render prunes the other's
+        d = self.video_dir(project_id) / "preview_segments"
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+
     def scene_image_path(self, project_id: str, index: int) -> Path:
         return self.images_dir(project_id) / f"scene_{index:03d}.png"
 
@@ -51,6 +64,26 @@ class LocalFileStorage:
     def video_output_path(self, project_id: str) -> Path:
         return self.video_dir(project_id) / "output.mp4"
 
+    def video_preview_path(self, project_id: str) -> Path:
+        return self.video_dir(project_id) / "preview.mp4"
+
+    def move_scene_assets(self, project_id: str, moves: dict[int, int]) -> None:
+        """Renumber per-scene asset files after scenes were reordered.
+
+        ``moves`` maps old scene index to new index. Files are first parked
+        under temporary names so swaps and rotations don't overwrite each other.
+        """
+        pending: list[tuple[Path, Path]] = []
+        for old_index, new_index in moves.items():
+            for path_fn in (self.scene_clip_path, self.scene_image_path, self.scene_audio_path):
+                src = path_fn(project_id, old_index)
+                if src.exists():
+                    parked = src.with_name(f".moving_{src.name}")
+                    src.rename(parked)
+                    pending.append((parked, path_fn(project_id, new_index)))
+        for parked, dest in pending:
+            parked.replace(dest)
+
     def delete_project_files(self, project_id: str) -> None:
         d = self.base / project_id
         if d.exists():
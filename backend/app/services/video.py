@@ -1,10 +1,55 @@
 import asyncio
-import math
+import json
+import os
 import tempfile
 import shutil
 from pathlib import Path
 
+from app.core.config import settings
 from app.services.base.video import VideoServiceBase, SceneInput
+from app.services.encoding import EncoderProfile, get_profile
+from app.services.executors import run_io
+from app.services.hashing import content_hash, file_hash
+
+# Encoder settings baked into every segment besides the profile's; change
+# this whenever segment encoding changes so cached segments are rebuilt
+SEGMENT_FORMAT = "libx264|yuv420p|aac-128k|v4"
+
+
+_digests: dict[tuple[str, int, int], str] = {}
+
+
+def _file_identity(path: Path) -> str:
+    """Hash of the file's bytes, so renamed inputs (reordered scenes) still
+    match their cached segment. Memoised on path, size and mtime so an
+    unchanged file is only read once per process."""
+    st = path.stat()
+    memo = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+    if memo not in _digests:
+        if len(_digests) >= 4096:
+            _digests.clear()
+        _digests[memo] = file_hash(path)
+    return _digests[memo]
+
+
+async def run_ffmpeg(cmd: list[str], stdin: bytes | None = None) -> None:
+    """Run an ffmpeg command, feeding it ``stdin`` if given; raise on failure."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, stderr = await proc.communicate(stdin)
+    except asyncio.CancelledError:
+        # Don't leave an orphaned encoder burning CPU (e.g. a preview the
+        # final render beat)
+        proc.kill()
+        await proc.wait()
+        raise
+    if proc.returncode != 0:
+        raise RuntimeError(f"FFmpeg failed: {stderr.decode()[-500:]}")
 
 
 async def _check_drawtext() -> bool:
@@ -21,18 +66,32 @@ async def _check_drawtext() -> bool:
 class FFmpegVideoService(VideoServiceBase):
     _has_drawtext: bool | None = None
 
+    def __init__(
+        self, workers: int | None = None, profile: EncoderProfile | None = None
+    ) -> None:
+        self.profile = profile or get_profile()
+        cpus = os.cpu_count() or 1
+        self.workers = max(1, workers or settings.FFMPEG_WORKERS or cpus)
+        # Split the cores between concurrent encoders instead of letting each
+        # libx264 process spawn a thread per core
+        self.threads = max(1, cpus // self.workers)
+        self._slots = asyncio.Semaphore(self.workers)
+
     async def _drawtext_available(self) -> bool:
         if FFmpegVideoService._has_drawtext is None:
             FFmpegVideoService._has_drawtext = await _check_drawtext()
         return FFmpegVideoService._has_drawtext
 
-    def _vf_filter(self, title: str, base: str = "scale=1280:720") -> str:
+    def _vf_filter(self, title: str, base: str | None = None) -> str:
         """Build the -vf filter string. Includes drawtext only if available."""
+        base = base or self.profile.scale
         if FFmpegVideoService._has_drawtext:
+            # Title size and offset scale with the profile (36px/40px at 720p)
+            height = self.profile.height
             return (
                 f"{base},drawtext=text='{self._escape(title)}'"
-                f":fontsize=36:fontcolor=white:borderw=2:bordercolor=black"
-                f":x=(w-text_w)/2:y=40"
+                f":fontsize={height // 20}:fontcolor=white:borderw=2:bordercolor=black"
+                f":x=(w-text_w)/2:y={height // 18}"
             )
         return base
 
@@ -40,6 +99,8 @@ class FFmpegVideoService(VideoServiceBase):
         self,
         scenes: list[SceneInput],
         output_path: Path,
+        *,
+        cache_dir: Path | None = None,
     ) -> None:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         tmp_dir = Path(tempfile.mkdtemp(prefix="studyscenes_"))
@@ -47,84 +108,137 @@ class FFmpegVideoService(VideoServiceBase):
         await self._drawtext_available()
 
         try:
-            segment_paths: list[Path] = []
-            for i, scene in enumerate(scenes):
-                seg_path = tmp_dir / f"segment_{i:03d}.mp4"
-                await self._make_segment(scene, seg_path, tmp_dir)
-                segment_paths.append(seg_path)
-
-            if len(segment_paths) == 1:
-                shutil.copy2(segment_paths[0], output_path)
-            else:
-                await self._concat(segment_paths, output_path, tmp_dir)
+            segment_dir = cache_dir or tmp_dir
+            tasks = [
+                asyncio.create_task(self.render_segment(scene, segment_dir))
+                for scene in scenes
+            ]
+            try:
+                # gather keeps scene order regardless of which encoder finishes first
+                segment_paths = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            await self._join(segment_paths, output_path, tmp_dir)
+            if cache_dir:
+                self._prune_segments(cache_dir, keep=set(segment_paths))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    async def render_segment(self, scene: SceneInput, segment_dir: Path) -> Path:
+        segment_dir.mkdir(parents=True, exist_ok=True)
+        await self._drawtext_available()
+
+        # Hashing the inputs reads them; keep that off the event loop
+        seg_path = segment_dir / f"{await run_io(self.segment_key, scene)}.mp4"
+        if seg_path.exists():
+            return seg_path
+
+        # Encode beside the cache so the final rename is atomic
+        tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp_", dir=segment_dir))
+        try:
+            partial = tmp_dir / seg_path.name
+            await self._make_segment(scene, partial)
+            partial.replace(seg_path)
         finally:
             shutil.rmtree(tmp_dir, ignore_errors=True)
+        return seg_path
+
+    def segment_key(self, scene: SceneInput) -> str:
+        """Hash of everything that determines a segment's encoded bytes."""
+        return content_hash(
+            _file_identity(scene.visual_path),
+            _file_identity(scene.audio_path),
+            scene.title,
+            FFmpegVideoService._has_drawtext,
+            scene.duration_sec,
+            self.profile.key,
+            SEGMENT_FORMAT,
+        )
 
-    async def _make_segment(
-        self, scene: SceneInput, seg_path: Path, tmp_dir: Path
+    @staticmethod
+    def _prune_segments(cache_dir: Path, keep: set[Path]) -> None:
+        """Drop cached segments the latest render no longer uses."""
+        for path in cache_dir.glob("*.mp4"):
+            if path not in keep:
+                path.unlink(missing_ok=True)
+
+    async def _join(
+        self, segment_paths: list[Path], output_path: Path, tmp_dir: Path
     ) -> None:
-        """Dispatch based on visual_path suffix."""
-        if scene.visual_path.suffix == ".mp4":
-            await self._mux_clip_and_audio(scene, seg_path, tmp_dir)
+        if len(segment_paths) == 1:
+            shutil.copy2(segment_paths[0], output_path)
         else:
-            await self._mux_image_and_audio(scene, seg_path)
+            await self._concat(segment_paths, output_path, tmp_dir)
 
-    async def _mux_clip_and_audio(
-        self, scene: SceneInput, seg_path: Path, tmp_dir: Path
-    ) -> None:
-        """Align video clip duration to audio, then mux together."""
-        clip_dur = await self._probe_duration(scene.visual_path)
-        audio_dur = scene.duration_sec
+    async def _make_segment(self, scene: SceneInput, seg_path: Path) -> None:
+        """Dispatch based on visual_path suffix, one encoder slot per segment."""
+        async with self._slots:
+            if scene.visual_path.suffix == ".mp4":
+                await self._mux_clip_and_audio(scene, seg_path)
+            else:
+                await self._mux_image_and_audio(scene, seg_path)
 
-        # Align clip duration to audio duration
-        aligned_path = tmp_dir / f"aligned_{seg_path.stem}.mp4"
-
-        if audio_dur > clip_dur and clip_dur > 0:
-            # Loop the clip to cover the audio duration
-            loops_needed = math.ceil(audio_dur / clip_dur) - 1
-            cmd = [
-                "ffmpeg", "-y",
-                "-stream_loop", str(loops_needed),
-                "-i", str(scene.visual_path),
-                "-t", str(audio_dur),
-                "-c:v", "libx264",
-                "-pix_fmt", "yuv420p",
-                "-r", "30",
-                str(aligned_path),
-            ]
-            await self._run(cmd)
-        elif audio_dur < clip_dur:
-            # Trim the clip to audio duration
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", str(scene.visual_path),
-                "-t", str(audio_dur),
-                "-c:v", "libx264",
-                "-pix_fmt", "yuv420p",
-                "-r", "30",
-                str(aligned_path),
-            ]
-            await self._run(cmd)
-        else:
-            aligned_path = scene.visual_path
+    async def _mux_clip_and_audio(self, scene: SceneInput, seg_path: Path) -> None:
+        """Loop/trim the clip to the narration and mux both in one ffmpeg pass.
 
-        # Mux aligned video + audio
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", str(aligned_path),
+        A clip that already runs as long as the narration and is encoded the
+        way segments are is stream-copied instead of re-encoded.
+        """
+        info = await self._probe_video(scene.visual_path)
+        clip_dur = float(info.get("duration") or 0)
+        audio_dur = scene.duration_sec
+        # Stream copy can only cut on keyframes, and a looped copy relies on
+        # timestamp wrap-around, so only copy a clip that needs no re-timing
+        copy_video = (
+            clip_dur > 0
+            and abs(clip_dur - audio_dur) <= 1 / self.profile.fps
+            and self._matches_segment_format(info)
+        )
+
+        cmd = ["ffmpeg", "-y"]
+        if not copy_video and audio_dur > clip_dur > 0:
+            # Loop the clip as often as needed; -t cuts it at the narration's end
+            cmd += ["-stream_loop", "-1"]
+        cmd += [
+            "-i", str(scene.visual_path),
             "-i", str(scene.audio_path),
-            "-c:v", "libx264",
-            "-pix_fmt", "yuv420p",
-            "-r", "30",
+            "-t", str(audio_dur),
+            "-map", "0:v:0",
+            "-map", "1:a:0",
+        ]
+        if copy_video:
+            cmd += ["-c:v", "copy"]
+        else:
+            # Letterbox rather than stretch clips of another aspect ratio; SAR 1
+            # keeps every segment alike for the stream-copy concat
+            cmd += ["-vf", self.profile.fit, *self.profile.video_args(self.threads)]
+        cmd += [
             "-c:a", "aac",
             "-b:a", "128k",
-            "-map", "0:v",
-            "-map", "1:a",
             "-shortest",
             str(seg_path),
         ]
         await self._run(cmd)
 
+    def _matches_segment_format(self, info: dict) -> bool:
+        """True if a clip's video stream can be copied into a segment as-is.
+
+        The H.264 profile has to match too: segments are later concatenated
+        with stream copy, which keeps a single set of H.264 parameters.
+        """
+        return (
+            info.get("codec_name") == "h264"
+            and info.get("profile") == "High"
+            and info.get("pix_fmt") == "yuv420p"
+            and str(info.get("width")) == str(self.profile.width)
+            and str(info.get("height")) == str(self.profile.height)
+            and info.get("r_frame_rate") == f"{self.profile.fps}/1"
+        )
+
     async def _mux_image_and_audio(
         self, scene: SceneInput, seg_path: Path
     ) -> None:
@@ -134,10 +248,8 @@ class FFmpegVideoService(VideoServiceBase):
             "-loop", "1",
             "-i", str(scene.visual_path),
             "-i", str(scene.audio_path),
-            "-c:v", "libx264",
+            *self.profile.video_args(self.threads),
             "-tune", "stillimage",
-            "-pix_fmt", "yuv420p",
-            "-r", "30",
             "-vf", self._vf_filter(scene.title),
             "-c:a", "aac",
             "-b:a", "128k",
@@ -148,13 +260,16 @@ class FFmpegVideoService(VideoServiceBase):
         ]
         await self._run(cmd)
 
-    async def _probe_duration(self, path: Path) -> float:
-        """Get media file duration in seconds via ffprobe."""
+    async def _probe_video(self, path: Path) -> dict:
+        """Codec, profile, pixel format, size, frame rate and duration of a
+        clip's first video stream via ffprobe; empty if it can't be read."""
         cmd = [
             "ffprobe",
             "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
+            "-select_streams", "v:0",
+            "-show_entries",
+            "stream=codec_name,profile,pix_fmt,width,height,r_frame_rate:format=duration",
+            "-of", "json",
             str(path),
         ]
         proc = await asyncio.create_subprocess_exec(
@@ -164,15 +279,19 @@ class FFmpegVideoService(VideoServiceBase):
         )
         stdout, _ = await proc.communicate()
         try:
-            return float(stdout.decode().strip())
+            probe = json.loads(stdout.decode())
         except ValueError:
-            return 0.0
+            return {}
+        streams = probe.get("streams") or [{}]
+        return {**streams[0], "duration": (probe.get("format") or {}).get("duration")}
 
     async def _concat(
         self, segment_paths: list[Path], output_path: Path, tmp_dir: Path
     ) -> None:
         concat_file = tmp_dir / "concat.txt"
-        lines = [f"file '{p}'\n" for p in segment_paths]
+        # Absolute: the demuxer resolves relative entries against the list's
+        # own (temp) directory, not the working directory
+        lines = [f"file '{self._concat_quote(p.resolve())}'\n" for p in segment_paths]
         concat_file.write_text("".join(lines))
 
         cmd = [
@@ -186,6 +305,10 @@ class FFmpegVideoService(VideoServiceBase):
         ]
         await self._run(cmd)
 
+    @staticmethod
+    def _concat_quote(path: Path) -> str:
+        return str(path).replace("'", "'\\''")
+
     @staticmethod
     def _escape(text: str) -> str:
         text = text.replace("\\", "\\\\")
@@ -193,13 +316,4 @@ class FFmpegVideoService(VideoServiceBase):
         text = text.replace("'", "\\'")
         return text
 
-    @staticmethod
-    async def _run(cmd: list[str]) -> None:
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        _, stderr = await proc.communicate()
-        if proc.returncode != 0:
-            raise RuntimeError(f"FFmpeg failed: {stderr.decode()[-500:]}")
+    _run = staticmethod(run_ffmpeg)
@@ -0,0 +1,94 @@
+import shutil
+import tempfile
+from pathlib import Path
+
+from app.services.base.video import SceneInput
+from app.services.video import FFmpegVideoService
+
+
+class FilterGraphVideoService(FFmpegVideoService):
+    """Render the whole video with one ffmpeg process and one filter_complex.
+
+    Every scene's visual and narration are inputs of a single graph: images
+    are looped, clips are looped/trimmed, titles are drawn, and all scenes
+    go through one concat filter, so the MP4 is decoded and encoded exactly
+    once instead of once per segment plus a concat pass. There are no
+    per-scene segments to cache, so ``cache_dir`` is ignored and a changed
+    scene re-renders the whole video.
+    """
+
+    renders_segments = False
+
+    async def stitch(
+        self,
+        scenes: list[SceneInput],
+        output_path: Path,
+        *,
+        cache_dir: Path | None = None,
+    ) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        await self._drawtext_available()
+
+        tmp_dir = Path(tempfile.mkdtemp(prefix="studyscenes_"))
+        try:
+            # The graph grows with the scene count; a script file keeps it
+            # clear of command-line length limits
+            graph_file = tmp_dir / "graph.txt"
+            graph_file.write_text(self._filter_graph(scenes))
+            await self._run(self._command(scenes, graph_file, output_path))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _command(
+        self, scenes: list[SceneInput], graph_file: Path, output_path: Path
+    ) -> list[str]:
+        cmd = ["ffmpeg", "-y"]
+        for scene in scenes:
+            duration = str(scene.duration_sec)
+            if scene.visual_path.suffix == ".mp4":
+                cmd += ["-stream_loop", "-1", "-t", duration, "-i", str(scene.visual_path)]
+            else:
+                cmd += ["-loop", "1", "-framerate", str(self.profile.fps), "-t", duration,
+                        "-i", str(scene.visual_path)]
+            cmd += ["-i", str(scene.audio_path)]
+
+        all_stills = all(scene.visual_path.suffix != ".mp4" for scene in scenes)
+        cmd += [
+            "-filter_complex_script", str(graph_file),
+            "-map", "[v]",
+            "-map", "[a]",
+            *self.profile.video_args(),
+            *(["-tune", "stillimage"] if all_stills else []),
+            "-c:a", "aac",
+            "-b:a", "128k",
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+        return cmd
+
+    def _filter_graph(self, scenes: list[SceneInput]) -> str:
+        """One chain per scene input, then a single concat of every scene."""
+        chains = []
+        pads = []
+        for i, scene in enumerate(scenes):
+            video_in, audio_in = 2 * i, 2 * i + 1
+            duration = scene.duration_sec
+            if scene.visual_path.suffix == ".mp4":
+                # Letterbox clips of another aspect ratio instead of stretching them
+                video = self.profile.fit
+            else:
+                video = self._vf_filter(scene.title)
+            chains.append(
+                f"[{video_in}:v]{video},setsar=1,fps={self.profile.fps},format=yuv420p,"
+                f"trim=duration={duration},setpts=PTS-STARTPTS[v{i}]"
+            )
+            # Pad/trim narration to the scene length so every scene keeps
+            # its audio and video in step through the concat
+            chains.append(
+                f"[{audio_in}:a]aformat=sample_rates=44100:channel_layouts=mono,"
+                f"apad=whole_dur={duration},atrim=duration={duration},"
+                f"asetpts=PTS-STARTPTS[a{i}]"
+            )
+            pads.append(f"[v{i}][a{i}]")
+        chains.append(f"{''.join(pads)}concat=n={len(scenes)}:v=1:a=1[v][a]")
+        return ";\n".join(chains) + "\n"
@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.core.database import Base
+from app.services import jobs
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    """A fresh SQLite database with all tables; the job queue is pointed at it too."""
+    # NullPool: each test drives the engine from several asyncio.run() loops
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+
+    async def create() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create())
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(jobs, "async_session", factory)
+    yield factory
+    asyncio.run(engine.dispose())
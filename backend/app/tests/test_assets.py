@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.models.project import Project
+from app.schemas.generation import ScriptResponse, ScriptScene
+from app.services import pipeline
+from app.services.base.image import ImageServiceBase
+from app.services.base.video_clip import VideoClipServiceBase
+from app.services.base.voice import VoiceServiceBase
+
+SCENES = [
+    ScriptScene(title=f"Scene {i}", narration=f"Narration {i}.", visual_desc=f"desc {i}")
+    for i in range(4)
+]
+
+
+class _FakeClipService(VideoClipServiceBase):
+    def __init__(self) -> None:
+        self.generated: list[str] = []
+
+    async def generate(self, scene_title, visual_desc, output_path, *, narration="", duration_sec=6):
+        self.generated.append(scene_title)
+        output_path.write_bytes(b"clip")
+
+
+class _FakeImageService(ImageServiceBase):
+    async def generate(self, title, visual_desc, output_path, *, narration="", key_points=None):
+        output_path.write_bytes(b"image")
+
+
+class _SlowFirstVoiceService(VoiceServiceBase):
+    """Narration for earlier scenes takes longer, so later scenes finish first."""
+
+    async def generate_scene(self, narration, output_path):
+        index = int(narration.split()[1].rstrip("."))
+        await asyncio.sleep(0.05 * (len(SCENES) - index))
+        output_path.write_bytes(b"audio")
+        return 2.0
+
+
+@pytest.fixture
+def project(session_factory, tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline.storage, "base", tmp_path)
+
+    async def create() -> str:
+        async with session_factory() as db:
+            project = Project(title="t", content="c")
+            db.add(project)
+            await db.commit()
+            await pipeline.save_script(project.id, ScriptResponse(scenes=SCENES), db)
+            return project.id
+
+    return asyncio.run(create())
+
+
+def test_clip_budget_goes_to_scenes_in_index_order(session_factory, project, monkeypatch):
+    clips = _FakeClipService()
+    monkeypatch.setattr(pipeline, "get_video_clip_service", lambda: clips)
+    monkeypatch.setattr(pipeline, "get_image_service", _FakeImageService)
+    monkeypatch.setattr(pipeline, "get_voice_service", _SlowFirstVoiceService)
+    monkeypatch.setattr(settings, "ASSET_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "ASSET_CONCURRENCY_ENABLED", True)
+    monkeypatch.setattr(settings, "CLIP_DURATION_MODE", "audio_first")
+    # Room for two of the four 2-second clips
+    monkeypatch.setattr(settings, "MAX_TOTAL_VIDEO_SECONDS", 4)
+
+    async def go() -> list[str]:
+        async with session_factory() as db:
+            await pipeline.generate_assets(project, db)
+            project_row = await pipeline._get_project(project, db, load_scenes=True)
+            return [scene.image_path for scene in project_row.scenes]
+
+    visuals = asyncio.run(go())
+    assert clips.generated == ["Scene 1", "Scene 0"]
+    assert [path.rsplit(".", 1)[1] for path in visuals] == ["mp4", "mp4", "png", "png"]
@@ -0,0 +1,224 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+
+from app import worker
+from app.core.config import settings
+from app.models.job import Job
+from app.services import jobs
+
+
+def _enqueue(factory, kind: str = "video", payload: dict | None = None) -> str:
+    async def go() -> str:
+        async with factory() as db:
+            return (await jobs.enqueue(db, "project-1", kind, payload)).id
+    return asyncio.run(go())
+
+
+def _get(factory, job_id: str) -> Job:
+    async def go() -> Job:
+        async with factory() as db:
+            return await db.get(Job, job_id)
+    return asyncio.run(go())
+
+
+def _set(factory, job_id: str, **values) -> None:
+    async def go() -> None:
+        async with factory() as db:
+            await db.execute(update(Job).where(Job.id == job_id).values(**values))
+            await db.commit()
+    asyncio.run(go())
+
+
+def _db_locked() -> OperationalError:
+    return OperationalError("UPDATE jobs", {}, Exception("database is locked"))
+
+
+def test_claim_leases_job_to_one_worker(session_factory):
+    job_id = _enqueue(session_factory)
+
+    claimed = asyncio.run(jobs.claim_next("w1"))
+    assert claimed.id == job_id
+    assert (claimed.status, claimed.worker_id, claimed.attempts) == ("in_progress", "w1", 1)
+    assert claimed.lease_expires_at is not None
+    assert asyncio.run(jobs.claim_next("w2")) is None
+
+
+def test_enqueue_reuses_active_job_with_same_payload(session_factory):
+    first = _enqueue(session_factory, payload={"profile": "draft"})
+    assert _enqueue(session_factory, payload={"profile": "draft"}) == first
+    assert _enqueue(session_factory, payload={"profile": "archival"}) != first
+
+
+def test_expired_lease_is_reclaimed_and_old_worker_loses_it(session_factory):
+    job_id = _enqueue(session_factory)
+    asyncio.run(jobs.claim_next("w1"))
+    _set(session_factory, job_id, lease_expires_at=jobs._utcnow() - timedelta(seconds=1))
+
+    reclaimed = asyncio.run(jobs.claim_next("w2"))
+    assert (reclaimed.id, reclaimed.worker_id, reclaimed.attempts) == (job_id, "w2", 2)
+
+    # The first worker's heartbeat and completion no longer apply
+    assert asyncio.run(jobs.heartbeat(job_id, "w1", {})) is False
+    asyncio.run(jobs.complete(job_id, "w1", {"video_path": "stale"}, {}))
+    job = _get(session_factory, job_id)
+    assert (job.status, job.worker_id, job.result) == ("in_progress", "w2", None)
+    assert asyncio.run(jobs.heartbeat(job_id, "w2", {})) is True
+
+
+def test_expired_lease_on_last_attempt_fails_job(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_MAX_ATTEMPTS", 1)
+    job_id = _enqueue(session_factory)
+    asyncio.run(jobs.claim_next("w1"))
+    _set(session_factory, job_id, lease_expires_at=jobs._utcnow() - timedelta(seconds=1))
+
+    assert asyncio.run(jobs.claim_next("w2")) is None
+    job = _get(session_factory, job_id)
+    assert (job.status, job.message) == ("failed", "Worker lease expired")
+
+
+def test_failed_attempt_retries_with_exponential_backoff(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETRY_BACKOFF_SECONDS", 10)
+    job_id = _enqueue(session_factory)
+
+    for attempt, delay in ((1, 10), (2, 20)):
+        asyncio.run(jobs.claim_next("w1"))
+        before = jobs._utcnow().replace(tzinfo=None)
+        asyncio.run(jobs.fail(job_id, "w1", "boom", {}))
+        job = _get(session_factory, job_id)
+        assert (job.status, job.attempts, job.message) == ("pending", attempt, "boom")
+        wait = (job.available_at - before).total_seconds()
+        assert delay - 1 < wait <= delay + 1
+
+        # Not claimable until the backoff has passed
+        assert asyncio.run(jobs.claim_next("w1")) is None
+        _set(session_factory, job_id, available_at=jobs._utcnow() - timedelta(seconds=1))
+
+    asyncio.run(jobs.claim_next("w1"))
+    asyncio.run(jobs.fail(job_id, "w1", "boom", {}))
+    assert _get(session_factory, job_id).status == "failed"
+
+
+def test_keep_alive_survives_transient_db_error(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_LEASE_SECONDS", 1.5)
+    calls = []
+
+    async def heartbeat(job_id, worker_id, stages):
+        calls.append(job_id)
+        if len(calls) == 1:
+            raise _db_locked()
+        return True
+
+    monkeypatch.setattr(jobs, "heartbeat", heartbeat)
+
+    async def go() -> None:
+        task = asyncio.create_task(asyncio.sleep(1.8))
+        keep_alive = asyncio.create_task(
+            worker._keep_alive("job", "w1", jobs.JobReporter("job"), task)
+        )
+        await task
+        await keep_alive
+        assert not task.cancelled()
+        assert len(calls) >= 2
+
+    asyncio.run(go())
+
+
+def test_keep_alive_abandons_job_when_lease_lost(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_LEASE_SECONDS", 0.3)
+
+    async def heartbeat(job_id, worker_id, stages):
+        return False
+
+    monkeypatch.setattr(jobs, "heartbeat", heartbeat)
+
+    async def go() -> None:
+        task = asyncio.create_task(asyncio.sleep(10))
+        await worker._keep_alive("job", "w1", jobs.JobReporter("job"), task)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(go())
+
+
+def test_keep_alive_abandons_job_when_db_stays_down(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_LEASE_SECONDS", 0.3)
+
+    async def heartbeat(job_id, worker_id, stages):
+        raise _db_locked()
+
+    monkeypatch.setattr(jobs, "heartbeat", heartbeat)
+
+    async def go() -> None:
+        task = asyncio.create_task(asyncio.sleep(10))
+        await worker._keep_alive("job", "w1", jobs.JobReporter("job"), task)
+        assert task.cancelling() or task.cancelled()
+
+    asyncio.run(go())
+
+
+def test_worker_keeps_polling_after_claim_error(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL", 0)
+    calls = []
+
+    class Stop(Exception):
+        pass
+
+    async def claim_next(worker_id):
+        calls.append(worker_id)
+        if len(calls) == 1:
+            raise _db_locked()
+        raise Stop
+
+    monkeypatch.setattr(jobs, "claim_next", claim_next)
+    with pytest.raises(Stop):
+        asyncio.run(worker.run_worker("w1"))
+    assert len(calls) == 2
+
+
+def test_executor_stats_come_from_worker_heartbeats(session_factory):
+    job_id = _enqueue(session_factory)
+    asyncio.run(jobs.claim_next("w1"))
+    pools = {"cpu": {"workers": 2, "in_flight": 3, "queued": 1}}
+    asyncio.run(jobs.heartbeat(job_id, "w1", {"executors": pools}))
+
+    async def go() -> list[dict]:
+        async with session_factory() as db:
+            return await jobs.executor_stats(db)
+
+    [entry] = asyncio.run(go())
+    assert (entry["worker_id"], entry["job_id"], entry["pools"]) == ("w1", job_id, pools)
+
+
+def test_non_retryable_failure_fails_at_once(session_factory):
+    job_id = _enqueue(session_factory)
+    asyncio.run(jobs.claim_next("w1"))
+    asyncio.run(jobs.fail(job_id, "w1", "Assets must be generated first", {}, retry=False))
+
+    job = _get(session_factory, job_id)
+    assert (job.status, job.attempts) == ("failed", 1)
+    assert asyncio.run(jobs.claim_next("w1")) is None
+
+
+def test_worker_does_not_retry_precondition_errors(session_factory, monkeypatch):
+    # The project doesn't exist, so no number of attempts will help
+    monkeypatch.setattr(worker, "async_session", session_factory)
+    job_id = _enqueue(session_factory)
+    job = asyncio.run(jobs.claim_next("w1"))
+
+    asyncio.run(worker.run_job(job, "w1"))
+    job = _get(session_factory, job_id)
+    assert (job.status, job.attempts) == ("failed", 1)
+    assert "not found" in job.message
+
+
+def test_worker_fails_unknown_kind_without_retry(session_factory):
+    job_id = _enqueue(session_factory, kind="transcode")
+    job = asyncio.run(jobs.claim_next("w1"))
+
+    asyncio.run(worker.run_job(job, "w1"))
+    job = _get(session_factory, job_id)
+    assert (job.status, job.message) == ("failed", "Unknown job kind: transcode")
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from app.models.project import Project
+from app.models.scene import Scene
+from app.services import pipeline
+from app.services.encoding import PREVIEW_PROFILE
+from app.services.jobs import JobReporter
+
+
+class _FailingVideoService:
+    async def stitch(self, scenes, output_path, *, cache_dir=None):
+        raise RuntimeError("FFmpeg failed: preview")
+
+
+class _FakeVideoService:
+    """Writes a placeholder video once ``release`` is set, recording when it started."""
+
+    def __init__(self, release: asyncio.Event | None = None) -> None:
+        self.release = release
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def stitch(self, scenes, output_path, *, cache_dir=None):
+        self.started.set()
+        try:
+            if self.release:
+                await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        output_path.write_bytes(b"video")
+
+
+@pytest.fixture
+def project(session_factory, tmp_path, monkeypatch):
+    """An assets_ready project with one scene."""
+    monkeypatch.setattr(pipeline.storage, "base", tmp_path)
+
+    async def create() -> str:
+        async with session_factory() as db:
+            project = Project(title="t", content="c", status="assets_ready")
+            db.add(project)
+            await db.flush()
+            db.add(Scene(
+                project_id=project.id, order_index=0, title="A", narration="n",
+                visual_desc="v", image_path="/storage/images/scene_000.png", duration_sec=2.0,
+            ))
+            await db.commit()
+            return project.id
+
+    return asyncio.run(create())
+
+
+def _generate(session_factory, project_id: str, reporter: JobReporter) -> str:
+    async def go() -> str:
+        async with session_factory() as db:
+            return await pipeline.generate_video(project_id, db, reporter)
+    return asyncio.run(go())
+
+
+def _use_services(monkeypatch, preview, final) -> None:
+    monkeypatch.setattr(
+        pipeline, "get_video_service",
+        lambda profile=None: preview if profile is PREVIEW_PROFILE else final,
+    )
+
+
+def test_preview_failure_is_not_fatal(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline.storage, "base", tmp_path)
+    monkeypatch.setattr(pipeline, "get_video_service", lambda profile=None: _FailingVideoService())
+    reporter = JobReporter()
+
+    assert asyncio.run(pipeline._render_preview("p", [], reporter, "Stitching...")) is None
+    assert "video" not in reporter.stages
+    assert not (tmp_path / "p" / "video" / "preview.mp4").exists()
+
+
+def test_final_render_does_not_wait_for_preview(session_factory, project, monkeypatch):
+    reporter = JobReporter()
+    seen = []
+
+    class Final(_FakeVideoService):
+        async def stitch(self, scenes, output_path, *, cache_dir=None):
+            # The preview is already under way, and finishes while the final
+            # render is still running
+            await preview.started.wait()
+            preview.release.set()
+            while reporter.stages["video"].get("preview_path") is None:
+                await asyncio.sleep(0.01)
+            seen.append(reporter.stages["video"]["preview_path"])
+            await super().stitch(scenes, output_path)
+
+    preview = _FakeVideoService(release=asyncio.Event())
+    _use_services(monkeypatch, preview, Final())
+
+    video_url = _generate(session_factory, project, reporter)
+    assert seen == [f"/storage/{project}/video/preview.mp4"]
+    assert video_url.endswith("video/output.mp4")
+    assert reporter.stages["video"]["preview_path"] is None
+    # The final video replaced the preview, so the file is gone too
+    assert not pipeline.storage.video_preview_path(project).exists()
+
+
+def test_preview_is_cancelled_when_final_video_is_first(session_factory, project, monkeypatch):
+    reporter = JobReporter()
+    preview = _FakeVideoService(release=asyncio.Event())  # never released
+
+    class Final(_FakeVideoService):
+        async def stitch(self, scenes, output_path, *, cache_dir=None):
+            await preview.started.wait()
+            await super().stitch(scenes, output_path)
+
+    _use_services(monkeypatch, preview, Final())
+
+    _generate(session_factory, project, reporter)
+    assert preview.cancelled
+    assert reporter.stages["video"]["status"] == "completed"
+    assert not pipeline.storage.video_preview_path(project).exists()
@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.models.project import Project
+from app.models.scene import Scene
+from app.schemas.generation import ScriptResponse, ScriptScene
+from app.services import pipeline
+
+A = ScriptScene(title="A", narration="Alpha narration.", visual_desc="alpha")
+B = ScriptScene(title="B", narration="Bravo narration.", visual_desc="bravo")
+C = ScriptScene(title="C", narration="Charlie narration.", visual_desc="charlie")
+
+
+@pytest.fixture
+def project(session_factory, tmp_path, monkeypatch):
+    """A project whose scenes A, B, C all have generated (checkpointed) assets."""
+    monkeypatch.setattr(pipeline.storage, "base", tmp_path)
+
+    async def create() -> str:
+        async with session_factory() as db:
+            project = Project(title="t", content="c")
+            db.add(project)
+            await db.commit()
+            await pipeline.save_script(project.id, ScriptResponse(scenes=[A, B, C]), db)
+
+            for scene in await _scenes(db, project.id):
+                i = scene.order_index
+                image = pipeline.storage.scene_image_path(project.id, i)
+                image.write_text(f"image {scene.title}")
+                pipeline.storage.scene_audio_path(project.id, i).write_text(f"audio {scene.title}")
+                scene.image_path = f"/storage/{pipeline.storage.relative_path(image)}"
+                scene.visual_hash = f"visual {scene.title}"
+                scene.audio_hash = f"audio {scene.title}"
+                scene.duration_sec = 5.0
+            await db.commit()
+            return project.id
+
+    return asyncio.run(create())
+
+
+async def _scenes(db, project_id: str) -> list[Scene]:
+    result = await db.execute(
+        select(Scene).where(Scene.project_id == project_id).order_by(Scene.order_index)
+    )
+    return list(result.scalars().all())
+
+
+def _save(session_factory, project_id: str, scenes: list[ScriptScene], outline=None) -> list[Scene]:
+    async def go() -> list[Scene]:
+        async with session_factory() as db:
+            if outline is not None:
+                (await db.get(Project, project_id)).outline = outline
+                await db.commit()
+            await pipeline.save_script(project_id, ScriptResponse(scenes=scenes), db)
+            return await _scenes(db, project_id)
+    return asyncio.run(go())
+
+
+def _ids(session_factory, project_id: str) -> dict[str, str]:
+    async def go() -> dict[str, str]:
+        async with session_factory() as db:
+            return {s.title: s.id for s in await _scenes(db, project_id)}
+    return asyncio.run(go())
+
+
+def _files(project_id: str, index: int) -> tuple[str, str]:
+    storage = pipeline.storage
+    return (
+        storage.scene_image_path(project_id, index).read_text(),
+        storage.scene_audio_path(project_id, index).read_text(),
+    )
+
+
+def test_unchanged_script_keeps_everything(session_factory, project):
+    ids = _ids(session_factory, project)
+    scenes = _save(session_factory, project, [A, B, C])
+
+    assert [s.id for s in scenes] == [ids["A"], ids["B"], ids["C"]]
+    assert all(not s.dirty for s in scenes)
+
+
+def test_rotation_moves_rows_checkpoints_and_files(session_factory, project):
+    ids = _ids(session_factory, project)
+    scenes = _save(session_factory, project, [C, A, B])
+
+    assert [(s.order_index, s.title) for s in scenes] == [(0, "C"), (1, "A"), (2, "B")]
+    assert [s.id for s in scenes] == [ids["C"], ids["A"], ids["B"]]
+    assert [s.visual_hash for s in scenes] == ["visual C", "visual A", "visual B"]
+    assert [s.audio_hash for s in scenes] == ["audio C", "audio A", "audio B"]
+    for i, title in enumerate("CAB"):
+        assert _files(project, i) == (f"image {title}", f"audio {title}")
+        assert scenes[i].image_path.endswith(f"images/scene_{i:03d}.png")
+
+
+def test_swap_back_restores_original_layout(session_factory, project):
+    _save(session_factory, project, [B, A, C])
+    scenes = _save(session_factory, project, [A, B, C])
+
+    assert [s.title for s in scenes] == ["A", "B", "C"]
+    assert all(not s.dirty for s in scenes)
+    for i, title in enumerate("ABC"):
+        assert _files(project, i) == (f"image {title}", f"audio {title}")
+
+
+def test_narration_edit_in_place_reuses_row(session_factory, project):
+    ids = _ids(session_factory, project)
+    edited = B.model_copy(update={"narration": "A much longer bravo narration than before."})
+    scenes = _save(session_factory, project, [A, edited, C])
+
+    assert scenes[1].id == ids["B"]
+    assert (scenes[1].visual_hash, scenes[1].audio_hash) == (None, None)
+    assert scenes[1].narration == edited.narration
+    assert scenes[1].duration_sec == pipeline._estimate_duration(edited.narration)
+    assert not scenes[0].dirty and not scenes[2].dirty
+
+
+def test_visual_edit_keeps_narration_checkpoint(session_factory, project):
+    edited = B.model_copy(update={"visual_desc": "bravo, redrawn"})
+    scenes = _save(session_factory, project, [A, edited, C])
+
+    assert scenes[1].visual_hash is None
+    assert (scenes[1].audio_hash, scenes[1].duration_sec) == ("audio B", 5.0)
+
+
+def test_delete_shifts_later_scenes_down(session_factory, project):
+    ids = _ids(session_factory, project)
+    scenes = _save(session_factory, project, [A, C])
+
+    assert [(s.order_index, s.id) for s in scenes] == [(0, ids["A"]), (1, ids["C"])]
+    assert not scenes[1].dirty
+    assert _files(project, 1) == ("image C", "audio C")
+    assert not pipeline.storage.scene_image_path(project, 2).exists()
+    assert not pipeline.storage.scene_audio_path(project, 2).exists()
+
+
+def test_moved_scene_redraws_when_key_points_differ(session_factory, project):
+    outline = {"sections": [
+        {"title": "A", "key_points": ["shared"]},
+        {"title": "B", "key_points": ["shared"]},
+        {"title": "C", "key_points": ["only C"]},
+    ]}
+    scenes = _save(session_factory, project, [A, C, B], outline=outline)
+
+    # Slides take key_points from the outline section at their index; B and
+    # C swap between sections with different key_points, A stays put
+    by_title = {s.title: s for s in scenes}
+    assert by_title["A"].visual_hash == "visual A"
+    assert by_title["B"].visual_hash is None
+    assert by_title["C"].visual_hash is None
+    # Narration is unaffected by key_points
+    assert by_title["B"].audio_hash == "audio B"
+    assert by_title["C"].audio_hash == "audio C"
+
+
+def test_move_between_equal_key_points_keeps_visual(session_factory, project):
+    outline = {"sections": [
+        {"title": "A", "key_points": ["same"]},
+        {"title": "B", "key_points": ["same"]},
+        {"title": "C", "key_points": ["other"]},
+    ]}
+    scenes = _save(session_factory, project, [B, A, C], outline=outline)
+
+    assert [s.visual_hash for s in scenes] == ["visual B", "visual A", "visual C"]
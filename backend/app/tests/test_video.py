@@ -0,0 +1,145 @@
+import asyncio
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.services.base.video import SceneInput
+from app.services.encoding import get_profile
+from app.services.mock.voice import SAMPLE_RATE, _write_beeps
+from app.services.storage import LocalFileStorage
+from app.services.video import FFmpegVideoService, run_ffmpeg
+
+needs_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def _make_scene(directory: Path, index: int, seconds: float = 1.0) -> SceneInput:
+    directory.mkdir(parents=True, exist_ok=True)
+    image = directory / f"scene_{index:03d}.png"
+    audio = directory / f"scene_{index:03d}.wav"
+    Image.new("RGB", (1280, 720), (40 * index, 80, 120)).save(image)
+    _write_beeps(audio, int(SAMPLE_RATE * seconds))
+    return SceneInput(visual_path=image, audio_path=audio, title=f"Scene {index}", duration_sec=seconds)
+
+
+def test_storage_base_is_absolute(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "STORAGE_PATH", "storage")
+    storage = LocalFileStorage()
+    assert storage.base.is_absolute()
+    assert storage.segments_dir("p").is_absolute()
+
+
+@needs_ffmpeg
+def test_stitch_with_relative_storage_root(tmp_path, monkeypatch):
+    # The concat list is written to a temp dir; relative segment paths must
+    # not be resolved against it
+    monkeypatch.chdir(tmp_path)
+    root = Path("storage") / "p"
+    scenes = [_make_scene(root / "assets", i) for i in range(2)]
+    output = root / "video" / "output.mp4"
+
+    svc = FFmpegVideoService(profile=get_profile("draft"))
+    asyncio.run(svc.stitch(scenes, output, cache_dir=root / "video" / "segments"))
+
+    assert output.stat().st_size > 0
+    assert len(list((root / "video" / "segments").glob("*.mp4"))) == 2
+
+
+def test_segment_key_survives_rename(tmp_path):
+    # Reordering scenes renames their files; the cached segment must still match
+    scene = _make_scene(tmp_path, 1)
+    svc = FFmpegVideoService(profile=get_profile("draft"))
+    before = svc.segment_key(scene)
+
+    moved = SceneInput(
+        visual_path=scene.visual_path.rename(tmp_path / "scene_000.png"),
+        audio_path=scene.audio_path.rename(tmp_path / "scene_000.wav"),
+        title=scene.title,
+        duration_sec=scene.duration_sec,
+    )
+    assert svc.segment_key(moved) == before
+
+
+def test_segment_key_changes_with_content(tmp_path):
+    scene = _make_scene(tmp_path, 1)
+    svc = FFmpegVideoService(profile=get_profile("draft"))
+    before = svc.segment_key(scene)
+
+    Image.new("RGB", (1280, 720), (0, 0, 0)).save(scene.visual_path)
+    assert svc.segment_key(scene) != before
+
+
+def _make_clip(path: Path, size: str, seconds: float, fps: int = 24) -> Path:
+    subprocess.run([
+        "ffmpeg", "-y", "-v", "error",
+        "-f", "lavfi", "-i", f"testsrc2=size={size}:rate={fps}:duration={seconds}",
+        "-c:v", "libx264", "-profile:v", "high", "-pix_fmt", "yuv420p", str(path),
+    ], check=True)
+    return path
+
+
+def _stream_info(path: Path) -> str:
+    """ffmpeg's description of the file's video stream (size, SAR, ...)."""
+    out = subprocess.run(["ffmpeg", "-hide_banner", "-i", str(path)], capture_output=True, text=True)
+    return next(line for line in out.stderr.splitlines() if "Video:" in line)
+
+
+def _duration(path: Path) -> float:
+    out = subprocess.run(["ffmpeg", "-hide_banner", "-i", str(path)], capture_output=True, text=True)
+    h, m, s = re.search(r"Duration: (\d+):(\d+):([\d.]+)", out.stderr).groups()
+    return int(h) * 3600 + int(m) * 60 + float(s)
+
+
+def _mux(tmp_path: Path, clip: Path, seconds: float, same_format: bool = False) -> tuple[list[str], Path]:
+    """Mux ``clip`` with ``seconds`` of narration; returns the ffmpeg command and segment.
+
+    ``same_format`` treats the clip as encoded exactly like a segment.
+    """
+    audio = tmp_path / "narration.wav"
+    _write_beeps(audio, int(SAMPLE_RATE * seconds))
+    scene = SceneInput(visual_path=clip, audio_path=audio, title="Clip", duration_sec=seconds)
+    svc = FFmpegVideoService(profile=get_profile("draft"))
+    if same_format:
+        svc._matches_segment_format = lambda info: True
+    commands = []
+
+    async def run(cmd):
+        commands.append(cmd)
+        await run_ffmpeg(cmd)
+
+    svc._run = run
+    segment = tmp_path / "segment.mp4"
+    asyncio.run(svc._mux_clip_and_audio(scene, segment))
+    return commands[0], segment
+
+
+@needs_ffmpeg
+def test_clip_of_narration_length_is_stream_copied(tmp_path):
+    clip = _make_clip(tmp_path / "clip.mp4", "854x480", 2)
+    cmd, _ = _mux(tmp_path, clip, 2.0, same_format=True)
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+
+
+@needs_ffmpeg
+def test_clip_needing_a_loop_is_reencoded_to_narration_length(tmp_path):
+    # Same format, but a copy could neither loop cleanly nor cut at 2.5s
+    clip = _make_clip(tmp_path / "clip.mp4", "854x480", 1)
+    cmd, segment = _mux(tmp_path, clip, 2.5, same_format=True)
+
+    assert "-stream_loop" in cmd
+    assert cmd[cmd.index("-c:v") + 1] == "libx264"
+    assert abs(_duration(segment) - 2.5) < 0.1
+
+
+@needs_ffmpeg
+def test_clip_of_other_aspect_ratio_is_letterboxed(tmp_path):
+    clip = _make_clip(tmp_path / "clip.mp4", "640x480", 1)
+    _, segment = _mux(tmp_path, clip, 1.0)
+
+    info = _stream_info(segment)
+    assert "854x480" in info and "SAR 1:1" in info
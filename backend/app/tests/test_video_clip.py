@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.services import rate_limit
+from app.services.base.video_clip import ClipRequest
+from app.services.real import video_clip as runway
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(settings, "RUNWAY_API_KEY", "test")
+    monkeypatch.setattr(settings, "RUNWAY_RPM", 0)
+    monkeypatch.setattr(settings, "RUNWAY_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "RUNWAY_MAX_TASKS", 4)
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    monkeypatch.setattr(runway, "_poller", runway._TaskPoller())
+    return runway.RunwayVideoClipService()
+
+
+def _requests(tmp_path, count: int) -> list[ClipRequest]:
+    return [ClipRequest(f"Scene {i}", "desc", tmp_path / f"scene_{i}.mp4") for i in range(count)]
+
+
+def _stub_runway(monkeypatch, svc, finished: asyncio.Event) -> list[str]:
+    """Tasks are accepted at once and only succeed when ``finished`` is set."""
+    submitted = []
+
+    async def submit(scene_title, prompt, duration):
+        submitted.append(scene_title)
+        return f"task-{len(submitted)}"
+
+    async def wait(task_id, headers):
+        await finished.wait()
+        return f"https://example.test/{task_id}.mp4"
+
+    async def download(client, url, output_path):
+        output_path.write_bytes(b"clip")
+
+    monkeypatch.setattr(svc, "_submit", submit)
+    monkeypatch.setattr(runway._poller, "wait", wait)
+    monkeypatch.setattr(svc, "_download", download)
+    return submitted
+
+
+def test_batch_submits_past_the_create_concurrency(service, monkeypatch, tmp_path):
+    async def go():
+        finished = asyncio.Event()
+        submitted = _stub_runway(monkeypatch, service, finished)
+        batch = asyncio.create_task(service.generate_batch(_requests(tmp_path, 4)))
+        await asyncio.sleep(0.05)
+
+        # All four tasks are on Runway's side although only two create calls
+        # may run at once: the limiter slot is not held while a task runs
+        assert len(submitted) == 4
+        assert rate_limit.get_limiter("runway")._in_flight == 0
+        finished.set()
+        return await batch
+
+    assert asyncio.run(go()) == [None] * 4
+    assert all((tmp_path / f"scene_{i}.mp4").exists() for i in range(4))
+
+
+def test_outstanding_tasks_are_capped(service, monkeypatch, tmp_path):
+    async def go():
+        finished = asyncio.Event()
+        submitted = _stub_runway(monkeypatch, service, finished)
+        batch = asyncio.create_task(service.generate_batch(_requests(tmp_path, 6)))
+        await asyncio.sleep(0.05)
+
+        assert len(submitted) == settings.RUNWAY_MAX_TASKS
+        finished.set()
+        await batch
+        return len(submitted)
+
+    assert asyncio.run(go()) == 6
+
+
+def test_batch_reports_each_failure(service, monkeypatch, tmp_path):
+    async def go():
+        finished = asyncio.Event()
+        finished.set()
+        _stub_runway(monkeypatch, service, finished)
+
+        async def wait(task_id, headers):
+            if task_id == "task-2":
+                raise RuntimeError("Runway task failed")
+            return f"https://example.test/{task_id}.mp4"
+
+        monkeypatch.setattr(runway._poller, "wait", wait)
+        return await service.generate_batch(_requests(tmp_path, 3))
+
+    results = asyncio.run(go())
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], RuntimeError)
@@ -0,0 +1,154 @@
+"""Background worker process: claims queued jobs and runs the pipeline.
+
+Run one or more alongside the API server:
+
+    python -m app.worker
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.job import Job
+from app.services import executors, jobs, pipeline
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_assets(job: Job, db, reporter: jobs.JobReporter) -> dict | None:
+    await pipeline.generate_assets(job.project_id, db, reporter)
+    return None
+
+
+async def _run_scene_assets(job: Job, db, reporter: jobs.JobReporter) -> dict | None:
+    await pipeline.regenerate_scene(job.project_id, job.payload["scene_index"], db, reporter)
+    return None
+
+
+async def _run_video(job: Job, db, reporter: jobs.JobReporter) -> dict | None:
+    video_path = await pipeline.generate_video(
+        job.project_id, db, reporter, profile=(job.payload or {}).get("profile")
+    )
+    return {"video_path": video_path}
+
+
+async def _run_all(job: Job, db, reporter: jobs.JobReporter) -> dict | None:
+    video_path = await pipeline.generate_all(
+        job.project_id, db, reporter, profile=(job.payload or {}).get("profile")
+    )
+    return {"video_path": video_path}
+
+
+HANDLERS = {
+    "assets": _run_assets,
+    "scene_assets": _run_scene_assets,
+    "video": _run_video,
+    "all": _run_all,
+}
+
+
+async def _keep_alive(
+    job_id: str, worker_id: str, reporter: jobs.JobReporter, task: asyncio.Task
+) -> None:
+    """Renew the lease and flush progress until the job task ends.
+
+    A failed heartbeat (e.g. "database is locked") is retried on the next
+    tick; only once the lease has certainly run out is the job abandoned.
+    """
+    # Often enough for status polling, and well inside the lease window
+    interval = min(settings.JOB_LEASE_SECONDS / 3, 1.0)
+    renewed_at = time.monotonic()
+    while not task.done():
+        await asyncio.sleep(interval)
+        # Persisted with the job so the API can show this worker's pools
+        pools = executors.stats()
+        reporter.update("executors", pools)
+        try:
+            held = await jobs.heartbeat(job_id, worker_id, reporter.stages)
+        except SQLAlchemyError as e:
+            if time.monotonic() - renewed_at < settings.JOB_LEASE_SECONDS:
+                logger.warning("Heartbeat for job %s failed, retrying: %s", job_id, e)
+                continue
+            logger.error("Could not renew lease on job %s in time: %s", job_id, e)
+            held = False
+        if not held:
+            logger.warning("Lost lease on job %s; abandoning it", job_id)
+            task.cancel()
+            return
+        renewed_at = time.monotonic()
+        if any(pool["queued"] for pool in pools.values()):
+            logger.info("Executor backlog for job %s: %s", job_id, pools)
+
+
+async def run_job(job: Job, worker_id: str) -> None:
+    handler = HANDLERS.get(job.kind)
+    if handler is None:
+        await jobs.fail(job.id, worker_id, f"Unknown job kind: {job.kind}", {}, retry=False)
+        return
+
+    reporter = jobs.JobReporter(job.id)
+
+    async def execute() -> dict | None:
+        async with async_session() as db:
+            return await handler(job, db, reporter)
+
+    task = asyncio.create_task(execute())
+    keep_alive = asyncio.create_task(_keep_alive(job.id, worker_id, reporter, task))
+    try:
+        result = await task
+    except asyncio.CancelledError:
+        if keep_alive.done():
+            return  # Lease lost; another worker owns the job now
+        raise
+    except pipeline.PreconditionError as e:
+        # The project isn't ready for this job; running it again won't change that
+        logger.warning("Job %s (%s) cannot run: %s", job.id, job.kind, e)
+        await jobs.fail(job.id, worker_id, str(e), reporter.stages, retry=False)
+        return
+    except Exception as e:
+        logger.exception("Job %s (%s) raised", job.id, job.kind)
+        await jobs.fail(job.id, worker_id, str(e), reporter.stages)
+        return
+    finally:
+        keep_alive.cancel()
+
+    await jobs.complete(job.id, worker_id, result, reporter.stages)
+    logger.info("Job %s (%s) completed", job.id, job.kind)
+
+
+async def run_worker(worker_id: str | None = None) -> None:
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+    logger.info("Worker %s started", worker_id)
+    while True:
+        try:
+            job = await jobs.claim_next(worker_id)
+        except SQLAlchemyError as e:
+            logger.warning("Could not claim a job, retrying: %s", e)
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+            continue
+        if job is None:
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+            continue
+        logger.info(
+            "Claimed job %s (%s) for project %s, attempt %d/%d",
+            job.id, job.kind, job.project_id, job.attempts, job.max_attempts,
+        )
+        try:
+            await run_job(job, worker_id)
+        except SQLAlchemyError as e:
+            # Recording the outcome failed; the lease expires and the job is retried
+            logger.error("Could not record the outcome of job %s: %s", job.id, e)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-5.5s [%(name)s] %(message)s")
+    try:
+        asyncio.run(run_worker())
+    finally:
+        executors.shutdown()
@@ -0,0 +1,71 @@
+"""Benchmark: single-pass filter_complex render vs. per-segment render + concat.
+
+Builds synthetic projects of mock slides + mock narration (every Nth scene a
+mock Ken Burns clip) and renders each one, without a segment cache, with
+FFmpegVideoService and FilterGraphVideoService.
+
+Usage: python bench_filtergraph.py [--scenes 2,6,12] [--clip-every 3]
+"""
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.base.video import SceneInput
+from app.services.base.video_clip import ClipRequest
+from app.services.mock.video_clip import MockVideoClipService
+from app.services.video import FFmpegVideoService
+from app.services.video_graph import FilterGraphVideoService
+from bench_stitch import build_scenes
+
+
+async def add_clips(scenes: list[SceneInput], work_dir: Path, every: int) -> None:
+    """Swap every ``every``-th scene's slide for a 6s clip (looped to its audio)."""
+    if every <= 0:
+        return
+    indices = range(0, len(scenes), every)
+    requests = [
+        ClipRequest(scenes[i].title, "Benchmark clip", work_dir / f"scene_{i:03d}.mp4")
+        for i in indices
+    ]
+    for i, request, error in zip(
+        indices, requests, await MockVideoClipService().generate_batch(requests)
+    ):
+        if error is not None:
+            raise error
+        scenes[i].visual_path = request.output_path
+
+
+async def timed(svc, scenes: list[SceneInput], output: Path) -> float:
+    start = time.perf_counter()
+    await svc.stitch(scenes, output)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenes", default="2,6,12", help="comma-separated scene counts")
+    parser.add_argument("--clip-every", type=int, default=3, help="0 = slides only")
+    args = parser.parse_args()
+    counts = [int(n) for n in args.scenes.split(",")]
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_graph_"))
+    try:
+        print(f"Preparing {max(counts)} scenes in {work_dir} ...")
+        scenes = await build_scenes(work_dir, max(counts))
+        await add_clips(scenes, work_dir, args.clip_every)
+
+        print(f"\n{'scenes':>7} {'segments (s)':>13} {'graph (s)':>10} {'speedup':>8}")
+        for count in counts:
+            subset = scenes[:count]
+            segments = await timed(FFmpegVideoService(), subset, work_dir / f"seg_{count}.mp4")
+            graph = await timed(FilterGraphVideoService(), subset, work_dir / f"graph_{count}.mp4")
+            print(f"{count:>7} {segments:>13.2f} {graph:>10.2f} {segments / graph:>7.2f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+"""Benchmark: mock Ken Burns clip rendering, previous vs. current ffmpeg command.
+
+Renders one mock slide, then encodes N-second clips from it with the old
+command (PNG input, default preset) and with MockVideoClipService's current
+command (raw frame on stdin, fast preset), and reports the speedup and PSNR
+of the new clip against the old one.
+
+Usage: python bench_ken_burns.py [--seconds 6] [--runs 3]
+"""
+import argparse
+import asyncio
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.mock.image import MockImageService
+from app.services.mock.video_clip import _ken_burns_cmd
+
+
+def render_previous(slide_path: Path, output_path: Path, duration_sec: int) -> None:
+    """The previous MockVideoClipService command, kept here as the baseline."""
+    total_frames = duration_sec * 30
+    vf = (
+        f"zoompan="
+        f"z='1+0.3*on/{total_frames}':"
+        f"x='iw/2-(iw/zoom/2)+on*0.5':"
+        f"y='ih/2-(ih/zoom/2)+on*0.3':"
+        f"d={total_frames}:s=1280x720:fps=30"
+    )
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-i", str(slide_path),
+            "-vf", vf,
+            "-c:v", "libx264",
+            "-pix_fmt", "yuv420p",
+            "-t", str(duration_sec),
+            str(output_path),
+        ],
+        check=True,
+    )
+
+
+def render_current(frame: bytes, output_path: Path, duration_sec: int) -> None:
+    cmd = _ken_burns_cmd(output_path, duration_sec)
+    subprocess.run([cmd[0], "-loglevel", "error", *cmd[1:]], input=frame, check=True)
+
+
+def psnr(a: Path, b: Path) -> str:
+    out = subprocess.run(
+        ["ffmpeg", "-i", str(a), "-i", str(b), "-lavfi", "psnr", "-f", "null", "-"],
+        capture_output=True, text=True,
+    ).stderr
+    match = re.search(r"average:(\S+)", out)
+    return match.group(1) if match else "?"
+
+
+async def render_slide(png_path: Path) -> bytes:
+    """Write the slide as PNG (old input) and return it as a raw frame (new input)."""
+    svc = MockImageService()
+    title, desc = "Benchmark slide", "A diagram of the light reactions."
+    narration = "Light is absorbed. Water is split. Oxygen is released. ATP is made."
+    await svc.generate(title, desc, png_path, narration=narration)
+    return await svc.render_frame(title, desc, narration=narration)
+
+
+def best_of(runs: int, fn, *args) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=int, default=6)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_kb_"))
+    try:
+        slide = work_dir / "slide.png"
+        frame = asyncio.run(render_slide(slide))
+
+        print(f"{args.seconds}s clip, best of {args.runs}:")
+        baseline = best_of(args.runs, render_previous, slide, work_dir / "previous.mp4", args.seconds)
+        print(f"  {'previous':<10} {baseline:>7.2f}s")
+        current = best_of(args.runs, render_current, frame, work_dir / "current.mp4", args.seconds)
+        print(f"  {'current':<10} {current:>7.2f}s  ({baseline / current:.2f}x)")
+        print(f"  PSNR vs previous: {psnr(work_dir / 'current.mp4', work_dir / 'previous.mp4')} dB")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark: FFmpegVideoService.stitch wall time vs. concurrent ffmpeg workers.
+
+Builds a synthetic project of mock slides + mock narration, then stitches it
+once per worker count.
+
+Usage: python bench_stitch.py [--scenes 12] [--workers 1,2,4]
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.base.video import SceneInput
+from app.services.mock.image import MockImageService
+from app.services.mock.voice import MockVoiceService
+from app.services.video import FFmpegVideoService
+
+
+async def build_scenes(work_dir: Path, count: int) -> list[SceneInput]:
+    image_svc = MockImageService()
+    voice_svc = MockVoiceService()
+    scenes = []
+    for i in range(count):
+        title = f"Benchmark scene {i + 1}"
+        narration = " ".join(["word"] * 25)  # ~10s of audio
+        img_path = work_dir / f"scene_{i:03d}.png"
+        audio_path = work_dir / f"scene_{i:03d}.wav"
+        await image_svc.generate(title, "Benchmark slide", img_path, narration=narration)
+        duration = await voice_svc.generate_scene(narration, audio_path)
+        scenes.append(SceneInput(
+            visual_path=img_path, audio_path=audio_path, title=title, duration_sec=duration,
+        ))
+    return scenes
+
+
+async def main() -> None:
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, cpus})
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenes", type=int, default=12)
+    parser.add_argument(
+        "--workers", default=",".join(str(w) for w in default_workers),
+        help="comma-separated worker counts to try",
+    )
+    args = parser.parse_args()
+    worker_counts = [int(w) for w in args.workers.split(",")]
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_stitch_"))
+    try:
+        print(f"Preparing {args.scenes} scenes in {work_dir} ...")
+        scenes = await build_scenes(work_dir, args.scenes)
+
+        print(f"\n{'workers':>8} {'threads':>8} {'wall (s)':>10} {'speedup':>8}")
+        baseline = None
+        for workers in worker_counts:
+            svc = FFmpegVideoService(workers=workers)
+            output = work_dir / f"out_{workers}.mp4"
+            start = time.perf_counter()
+            await svc.stitch(scenes, output)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {svc.threads:>8} {elapsed:>10.2f} {baseline / elapsed:>7.2f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,4 +1,7 @@
-"""End-to-end pipeline test: create project → outline → script → assets → video"""
+"""End-to-end pipeline test: create project → outline → script → assets → video
+
+Needs the API server and at least one worker (`make backend`, `make worker`).
+"""
 import json
 import os
 import time
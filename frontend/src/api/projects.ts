@@ -27,8 +27,10 @@ export async function deleteProject(id: string): Promise<void> {
   await api.delete(`/projects/${id}`);
 }
 
-export async function generateOutline(id: string): Promise<Outline> {
-  const { data } = await api.post(`/projects/${id}/generate/outline`);
+export async function generateOutline(id: string, fresh = false): Promise<Outline> {
+  const { data } = await api.post(`/projects/${id}/generate/outline`, null, {
+    params: fresh ? { fresh: true } : undefined,
+  });
   return data;
 }
 
@@ -51,13 +53,21 @@ export async function startAssetGeneration(id: string): Promise<void> {
   await api.post(`/projects/${id}/generate/assets`);
 }
 
+export async function regenerateScene(id: string, sceneIndex: number): Promise<void> {
+  await api.post(`/projects/${id}/scenes/${sceneIndex}/regenerate`);
+}
+
 export async function getAssetStatus(id: string): Promise<AssetStatus> {
   const { data } = await api.get(`/projects/${id}/generate/assets/status`);
   return data;
 }
 
-export async function startVideoGeneration(id: string): Promise<void> {
-  await api.post(`/projects/${id}/generate/video`);
+export type EncoderProfile = 'draft' | 'standard' | 'archival';
+
+export async function startVideoGeneration(id: string, profile?: EncoderProfile): Promise<void> {
+  await api.post(`/projects/${id}/generate/video`, null, {
+    params: profile ? { profile } : undefined,
+  });
 }
 
 export async function getVideoStatus(id: string): Promise<VideoStatus> {
@@ -2,10 +2,12 @@ import { useState, useEffect, useRef, useCallback } from 'react';
 import type { Project } from '../../types';
 import {
   startAssetGeneration,
+  regenerateScene,
   getAssetStatus,
   startVideoGeneration,
   getVideoStatus,
 } from '../../api/projects';
+import type { EncoderProfile } from '../../api/projects';
 import Button from '../common/Button';
 import ProgressBar from '../common/ProgressBar';
 
@@ -17,6 +19,13 @@ interface StepGenerateProps {
 
 type Phase = 'idle' | 'assets' | 'video' | 'done' | 'error';
 
+const PROFILE_OPTIONS: { value: EncoderProfile | ''; label: string }[] = [
+  { value: '', label: 'Default quality' },
+  { value: 'draft', label: 'Draft (fastest, 480p)' },
+  { value: 'standard', label: 'Standard (720p)' },
+  { value: 'archival', label: 'Archival (slowest, best)' },
+];
+
 export default function StepGenerate({ project, onUpdate, onNext }: StepGenerateProps) {
   const [phase, setPhase] = useState<Phase>(
     project.status === 'video_ready' ? 'done' : project.status === 'assets_ready' ? 'idle' : 'idle'
@@ -24,6 +33,8 @@ export default function StepGenerate({ project, onUpdate, onNext }: StepGenerate
   const [progress, setProgress] = useState(0);
   const [message, setMessage] = useState('');
   const [error, setError] = useState('');
+  const [previewUrl, setPreviewUrl] = useState<string | null>(null);
+  const [profile, setProfile] = useState<EncoderProfile | ''>('');
   const pollRef = useRef<ReturnType<typeof setInterval> | null>(null);
 
   const cleanup = useCallback(() => {
@@ -50,6 +61,23 @@ export default function StepGenerate({ project, onUpdate, onNext }: StepGenerate
     }
   }
 
+  async function handleRegenerateScene(index: number) {
+    setError('');
+    setPhase('assets');
+    setProgress(0);
+    setMessage(`Regenerating scene ${index + 1}...`);
+
+    try {
+      // Only this scene's assets are redone; the video re-stitch that follows
+      // reuses every other scene's cached segment
+      await regenerateScene(project.id, index);
+      pollAssets();
+    } catch {
+      setPhase('error');
+      setError(`Failed to start regenerating scene ${index + 1}`);
+    }
+  }
+
   function pollAssets() {
     cleanup();
     pollRef.current = setInterval(async () => {
@@ -79,10 +107,11 @@ export default function StepGenerate({ project, onUpdate, onNext }: StepGenerate
   async function startVideoPhase() {
     setPhase('video');
     setProgress(0);
+    setPreviewUrl(null);
     setMessage('Starting video stitching...');
 
     try {
-      await startVideoGeneration(project.id);
+      await startVideoGeneration(project.id, profile || undefined);
       pollVideo();
     } catch {
       setPhase('error');
@@ -97,6 +126,7 @@ export default function StepGenerate({ project, onUpdate, onNext }: StepGenerate
         const status = await getVideoStatus(project.id);
         setProgress(status.progress);
         setMessage(status.message);
+        setPreviewUrl(status.preview_path);
 
         if (status.status === 'completed') {
           cleanup();
@@ -119,6 +149,22 @@ export default function StepGenerate({ project, onUpdate, onNext }: StepGenerate
     }, 1500);
   }
 
+  const hasAssets = project.status === 'assets_ready' || project.status === 'video_ready';
+
+  const profileSelect = (
+    <select
+      value={profile}
+      onChange={(e) => setProfile(e.target.value as EncoderProfile | '')}
+      className="text-sm text-gray-700 border border-gray-300 rounded-lg px-3 py-2 focus:border-indigo-500 focus:outline-none"
+    >
+      {PROFILE_OPTIONS.map((option) => (
+        <option key={option.value} value={option.value}>
+          {option.label}
+        </option>
+      ))}
+    </select>
+  );
+
   return (
     <div>
       <h2 className="text-xl font-semibold text-gray-900 mb-4">Generate Video</h2>
@@ -133,7 +179,10 @@ export default function StepGenerate({ project, onUpdate, onNext }: StepGenerate
           <p className="text-sm text-gray-400 mb-6">
             {project.script?.scenes.length || 0} scenes to process
           </p>
-          <Button onClick={handleStart}>Generate Video</Button>
+          <div className="flex justify-center gap-3">
+            {profileSelect}
+            <Button onClick={handleStart}>Generate Video</Button>
+          </div>
         </div>
       )}
 
@@ -148,6 +197,18 @@ export default function StepGenerate({ project, onUpdate, onNext }: StepGenerate
         <div className="py-8">
           <p className="text-sm font-medium text-gray-700 mb-4">Stitching video...</p>
           <ProgressBar progress={progress} message={message} />
+          {previewUrl && (
+            <div className="mt-6">
+              <p className="text-sm text-gray-500 mb-2">
+                Low-resolution preview — the full-quality video replaces it when ready.
+              </p>
+              <div className="bg-black rounded-lg overflow-hidden">
+                <video controls className="w-full max-h-[360px]" src={previewUrl}>
+                  Your browser does not support the video tag.
+                </video>
+              </div>
+            </div>
+          )}
         </div>
       )}
 
@@ -160,8 +221,30 @@ export default function StepGenerate({ project, onUpdate, onNext }: StepGenerate
         </div>
       )}
 
+      {(phase === 'idle' || phase === 'done') && hasAssets && (
+        <div className="mt-4">
+          <h3 className="text-sm font-medium text-gray-700 mb-2">Scenes</h3>
+          <p className="text-xs text-gray-400 mb-3">
+            Regenerate one scene's visual and narration, then re-stitch the video.
+          </p>
+          <ul className="divide-y divide-gray-100 border border-gray-200 rounded-lg bg-white">
+            {project.scenes.map((scene, i) => (
+              <li key={scene.id} className="flex items-center justify-between gap-3 px-4 py-2">
+                <span className="text-sm text-gray-700 truncate">
+                  {i + 1}. {scene.title}
+                </span>
+                <Button variant="secondary" onClick={() => handleRegenerateScene(i)}>
+                  Regenerate
+                </Button>
+              </li>
+            ))}
+          </ul>
+        </div>
+      )}
+
       {phase === 'error' && (
-        <div className="text-center py-4">
+        <div className="flex justify-center gap-3 py-4">
+          {profileSelect}
           <Button onClick={handleStart}>Retry</Button>
         </div>
       )}
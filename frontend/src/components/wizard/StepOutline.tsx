@@ -16,11 +16,11 @@ export default function StepOutline({ project, onUpdate, onNext }: StepOutlinePr
   const [saving, setSaving] = useState(false);
   const [error, setError] = useState('');
 
-  async function handleGenerate() {
+  async function handleGenerate(fresh = false) {
     try {
       setGenerating(true);
       setError('');
-      const data = await generateOutline(project.id);
+      const data = await generateOutline(project.id, fresh);
       setOutline(data);
       onUpdate({ ...project, outline: data, status: 'outline_ready' });
     } catch {
@@ -74,7 +74,7 @@ export default function StepOutline({ project, onUpdate, onNext }: StepOutlinePr
       {!outline ? (
         <div className="text-center py-8">
           <p className="text-gray-500 mb-4">Generate an outline from your study content</p>
-          <Button onClick={handleGenerate}>Generate Outline</Button>
+          <Button onClick={() => handleGenerate()}>Generate Outline</Button>
         </div>
       ) : (
         <>
@@ -143,7 +143,7 @@ export default function StepOutline({ project, onUpdate, onNext }: StepOutlinePr
             <Button onClick={handleSave} loading={saving} variant="secondary">
               Save Changes
             </Button>
-            <Button onClick={handleGenerate} variant="secondary">
+            <Button onClick={() => handleGenerate(true)} variant="secondary">
               Regenerate
             </Button>
             <Button onClick={onNext}>Continue to Script</Button>
@@ -29,6 +29,7 @@ export interface Scene {
   visual_desc: string;
   image_path: string | null;
   duration_sec: number;
+  dirty: boolean;
   created_at: string;
 }
 
@@ -61,5 +62,6 @@ export interface VideoStatus {
   status: string;
   progress: number;
   video_path: string | null;
+  preview_path: string | null;
   message: string;
 }